@@ -0,0 +1,50 @@
+"""
+Apex Dynamics planetary gearbox SKU catalogs.
+
+Importing the package does no work: the public names below are resolved on
+first access (PEP 562), and each series definition is imported only when the
+series is first requested. NumPy is loaded by the modules that need it, not by
+the package itself.
+"""
+from importlib import import_module
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "ExclusionRule": "spec",
+    "SeriesSpec": "spec",
+    "SERIES_NAMES": "registry",
+    "get_series": "registry",
+    "resolve_series": "registry",
+    "AvailabilityMatrix": "availability",
+    "compile_availability": "availability",
+    "SeriesGrid": "engine",
+    "SkuCodec": "codec",
+    "InvalidSkuError": "parsing",
+    "SkuParser": "parsing",
+    "SkuQuery": "query",
+    "query_skus": "query",
+    "count_skus": "query",
+    "catalog_stats": "stats",
+    "series_stats": "stats",
+    "write_series_csv": "stream",
+    "generate_series": "parallel",
+    "generate_apex_skus": "generators",
+    "generate_apex_af_afr_skus": "generators",
+    "generate_apex_afx_afxr_skus": "generators",
+    "generate_apex_ad_adr_ads_skus": "generators",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'apex_skus' has no attribute '{name}'")
+    value = getattr(import_module(f"apex_skus.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,161 @@
+from functools import lru_cache
+
+# Compiled specs kept per process; bounded so a long-running process that
+# keeps reloading edited specs (watch mode) does not hold every old version
+SPEC_CACHE_SIZE = 32
+
+
+def _popcount(bits):
+    return bin(bits).count("1")
+
+
+class AvailabilityMatrix:
+    """
+    Compiled availability of one series: for every gearbox size, an int bitmask
+    over ratio indices where bit j set means spec.ratios[j] can be ordered.
+
+    Each exclusion rule is compiled the same way (rule_masks[k][i] holds the
+    ratio bits rule k removes from size i), so "is this pair available",
+    "which ratios exist for ABR142A" and "which rule removed this pair" are
+    single bit operations. Use compile_availability() to get the cached
+    matrix of a spec.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.sizes = spec.sizes
+        self.ratios = spec.ratios
+        self._size_index = {size: i for i, size in enumerate(self.sizes)}
+        self._ratio_index = {ratio: j for j, ratio in enumerate(self.ratios)}
+        full = (1 << len(self.ratios)) - 1
+        rule_masks = []
+        size_masks = [full] * len(self.sizes)
+        for rule in spec.exclusions:
+            bits = 0
+            for ratio in rule.ratios:
+                bits |= 1 << self._ratio_index[ratio]
+            per_size = [0] * len(self.sizes)
+            for size in rule.sizes:
+                i = self._size_index[size]
+                per_size[i] = bits
+                size_masks[i] &= ~bits
+            rule_masks.append(tuple(per_size))
+        self.size_masks = tuple(size_masks)
+        self.rule_masks = tuple(rule_masks)
+
+    def __repr__(self):
+        return (f"<AvailabilityMatrix {self.spec.name}: {len(self.sizes)} sizes x "
+                f"{len(self.ratios)} ratios, {self.pair_count()} available>")
+
+    def size_index(self, size):
+        return self._size_index[size]
+
+    def ratio_index(self, ratio):
+        return self._ratio_index[ratio]
+
+    def has_size(self, size):
+        return size in self._size_index
+
+    def has_ratio(self, ratio):
+        return ratio in self._ratio_index
+
+    def is_available(self, size, ratio):
+        """
+        True if the (size, ratio) pair can be ordered; False for excluded pairs
+        and for sizes or ratios the series does not list.
+        """
+        i = self._size_index.get(size)
+        j = self._ratio_index.get(ratio)
+        if i is None or j is None:
+            return False
+        return bool(self.size_masks[i] >> j & 1)
+
+    def ratios_for(self, size):
+        """
+        Available ratios of a size, in ascending order.
+        """
+        bits = self.size_masks[self._size_index[size]]
+        return [ratio for j, ratio in enumerate(self.ratios) if bits >> j & 1]
+
+    def sizes_for(self, ratio):
+        """
+        Sizes on which a ratio is available, in catalog order.
+        """
+        j = self._ratio_index[ratio]
+        return [size for size, bits in zip(self.sizes, self.size_masks) if bits >> j & 1]
+
+    def excluded_by(self, size, ratio):
+        """
+        The exclusion rules that remove a (size, ratio) pair; empty if it is available.
+        """
+        i = self._size_index[size]
+        bit = 1 << self._ratio_index[ratio]
+        return [rule for rule, per_size in zip(self.spec.exclusions, self.rule_masks)
+                if per_size[i] & bit]
+
+    def pair_count(self, size=None):
+        """
+        Number of available (size, ratio) pairs, for one size or the whole series.
+        """
+        if size is not None:
+            return _popcount(self.size_masks[self._size_index[size]])
+        return sum(_popcount(bits) for bits in self.size_masks)
+
+    def rule_pair_count(self, index, unique=False):
+        """
+        Number of (size, ratio) pairs exclusion rule `index` removes; with
+        unique, only those no other rule removes as well.
+        """
+        count = 0
+        for i, bits in enumerate(self.rule_masks[index]):
+            if unique:
+                for other_index, other in enumerate(self.rule_masks):
+                    if other_index != index:
+                        bits &= ~other[i]
+            count += _popcount(bits)
+        return count
+
+    def to_array(self):
+        """
+        The matrix as a fresh NumPy bool array of shape (sizes, ratios).
+        """
+        import numpy as np
+
+        ratio_bits = 1 << np.arange(len(self.ratios), dtype=object)
+        masks = np.array(self.size_masks, dtype=object)[:, None]
+        return (masks & ratio_bits[None, :]).astype(bool)
+
+    def to_dict(self):
+        """
+        Plain-data view: available ratios per size and the removals of each rule.
+        """
+        return {
+            "series": self.spec.name,
+            "ratios": list(self.ratios),
+            "available": {size: self.ratios_for(size) for size in self.sizes},
+            "exclusions": {
+                rule.description: {size: [ratio for j, ratio in enumerate(self.ratios) if bits >> j & 1]
+                                   for size, bits in zip(self.sizes, per_size) if bits}
+                for rule, per_size in zip(self.spec.exclusions, self.rule_masks)
+            },
+        }
+
+    def format_grid(self):
+        """
+        Renders the matrix as text: one line per size, '#' available, '-' excluded.
+        """
+        width = max(len(size) for size in self.sizes)
+        header = " " * width + " " + " ".join(f"{ratio:>3}" for ratio in self.ratios)
+        lines = [header]
+        for size, bits in zip(self.sizes, self.size_masks):
+            cells = " ".join("  #" if bits >> j & 1 else "  -" for j in range(len(self.ratios)))
+            lines.append(f"{size:<{width}} {cells}")
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def compile_availability(spec):
+    """
+    Returns the (cached) AvailabilityMatrix of a SeriesSpec.
+    """
+    return AvailabilityMatrix(spec)
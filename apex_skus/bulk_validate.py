@@ -0,0 +1,132 @@
+import csv
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from apex_skus.parallel import ordered_results
+from apex_skus.parsing import InvalidSkuError, SkuParser
+
+DEFAULT_CHUNK_LINES = 100000
+
+VERDICT_CSV_HEADER = ["Line", "SKU", "Verdict", "Series", "Reason"]
+
+# Parser of the current worker process, built once by _init_worker, and the
+# verdicts it already produced: order files repeat the same codes many times
+_parser = None
+_verdicts = {}
+_VERDICT_CACHE_LIMIT = 1000000
+
+
+def _init_worker(specs):
+    global _parser
+    _parser = SkuParser(specs)
+    _verdicts.clear()
+
+
+def _verdict(sku):
+    """
+    (verdict, series, reason) for one stripped, non-empty code.
+    """
+    try:
+        parts = _parser.check(sku)
+    except InvalidSkuError as error:
+        return "invalid", "", error.reason
+    return "valid", parts.series, ""
+
+
+def _validate_chunk(first_line_number, lines):
+    """
+    Worker task: validates a block of input lines and returns (verdict rows
+    rendered as CSV text, number of valid lines, number of lines).
+    """
+    buffer = io.StringIO()
+    csv_writer = csv.writer(buffer)
+    valid = 0
+    if len(_verdicts) > _VERDICT_CACHE_LIMIT:
+        _verdicts.clear()
+    for line_number, line in enumerate(lines, first_line_number):
+        sku = line.strip()
+        if not sku:
+            csv_writer.writerow((line_number, "", "invalid", "", "empty line"))
+            continue
+        verdict = _verdicts.get(sku)
+        if verdict is None:
+            verdict = _verdicts[sku] = _verdict(sku)
+        csv_writer.writerow((line_number, sku) + verdict)
+        if verdict[0] == "valid":
+            valid += 1
+    return buffer.getvalue(), valid, len(lines)
+
+
+def _line_chunks(lines, chunk_lines):
+    lines = iter(lines)
+    line_number = 1
+    while True:
+        chunk = list(islice(lines, chunk_lines))
+        if not chunk:
+            return
+        yield line_number, chunk
+        line_number += len(chunk)
+
+
+def validate_lines(lines, out, specs=None, workers=None, chunk_lines=DEFAULT_CHUNK_LINES):
+    """
+    Checks every line of an order file (one SKU per line) against the series
+    definitions and writes one CSV verdict row per line to out: line number,
+    SKU, valid/invalid, series and the reason for invalid lines.
+
+    Lines are parsed structurally into size, ratio, optional shaft and backlash
+    and checked against the compiled availability matrices; no catalog is
+    loaded. Blocks of chunk_lines lines are validated on a process pool of
+    `workers` processes (default: os.cpu_count(); 1 validates in-process) and
+    their verdicts are written in input order. Returns {"lines", "valid",
+    "invalid", "seconds", "lines_per_second"}.
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    out.write(",".join(VERDICT_CSV_HEADER) + "\r\n")
+    total = valid = 0
+
+    def consume(result):
+        nonlocal total, valid
+        text, chunk_valid, line_count = result
+        out.write(text)
+        total += line_count
+        valid += chunk_valid
+
+    if workers == 1:
+        _init_worker(specs)
+        for first_line_number, chunk in _line_chunks(lines, chunk_lines):
+            consume(_validate_chunk(first_line_number, chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(specs,)) as pool:
+            for result in ordered_results(pool, _validate_chunk, _line_chunks(lines, chunk_lines), workers * 2):
+                consume(result)
+
+    seconds = time.perf_counter() - started
+    return {
+        "lines": total,
+        "valid": valid,
+        "invalid": total - valid,
+        "seconds": seconds,
+        "lines_per_second": total / seconds if seconds else 0.0,
+    }
+
+
+def validate_file(input_path, output_path=None, specs=None, workers=None, chunk_lines=DEFAULT_CHUNK_LINES):
+    """
+    validate_lines for a file ("-" reads standard input); verdicts go to
+    output_path, or standard output when it is None.
+    """
+    source = sys.stdin if input_path == "-" else open(input_path)
+    try:
+        if output_path is None:
+            return validate_lines(source, sys.stdout, specs, workers, chunk_lines)
+        with open(output_path, 'w', newline='') as out:
+            return validate_lines(source, out, specs, workers, chunk_lines)
+    finally:
+        if source is not sys.stdin:
+            source.close()
@@ -0,0 +1,317 @@
+import argparse
+import json
+import os
+import sys
+
+from apex_skus.registry import SERIES_NAMES
+from apex_skus.stream import DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE, DEFAULT_SHARD_ROWS
+
+
+def _add_series_argument(parser):
+    parser.add_argument("--series", nargs="+", metavar="NAME", type=str.upper, choices=SERIES_NAMES,
+                        help="series to include (default: all of %(choices)s)")
+
+
+def _positive_int(text):
+    """
+    argparse type for counts that must be at least 1.
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{text}'")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return value
+
+
+def _spec_source(text):
+    """
+    argparse type for a spec version: "current" or an existing path.
+    """
+    if text != "current" and not os.path.exists(text):
+        raise argparse.ArgumentTypeError(f"no such spec file or directory: '{text}'")
+    return text
+
+
+def _run_diff(args):
+    from apex_skus.diff import iter_catalog_diff, write_diff
+    from apex_skus.registry import load_specs
+
+    records = iter_catalog_diff(load_specs(args.old), load_specs(args.new), args.series)
+    if args.output is None:
+        counts = write_diff(records, sys.stdout, args.format)
+    else:
+        with open(args.output, 'w', newline='') as out:
+            counts = write_diff(records, out, args.format)
+    print(f"{counts['added']} SKUs added, {counts['removed']} SKUs removed", file=sys.stderr)
+
+
+def _run_export(args):
+    from apex_skus.columnar import write_columnar
+
+    output_format, row_count = write_columnar(args.output, args.series, args.format, args.chunk_size)
+    print(f"Successfully exported {row_count} SKUs as {output_format} to '{args.output}'")
+
+
+def _run_sqlite(args):
+    from apex_skus.sqlite_sink import load_sqlite, sync_sqlite
+
+    if args.full:
+        for name, row_count in load_sqlite(args.database, args.series, args.batch_size).items():
+            print(f"Loaded {row_count} {name} Series SKUs into '{args.database}'")
+        return
+    for name, change in sync_sqlite(args.database, args.series, args.batch_size).items():
+        print(f"{name} Series: {change['mode']}, {change['added']} rows upserted, {change['removed']} rows deleted")
+
+
+def _run_validate(args):
+    from apex_skus.bulk_validate import validate_file
+
+    report = validate_file(args.input, args.output, args.series, args.workers, args.chunk_lines)
+    print(f"Validated {report['lines']} lines ({report['valid']} valid, {report['invalid']} invalid) "
+          f"in {report['seconds']:.2f}s: {report['lines_per_second']:,.0f} lines/s", file=sys.stderr)
+
+
+def _run_stats(args):
+    from apex_skus.stats import catalog_stats, format_stats
+
+    stats = catalog_stats(args.series)
+    if args.json:
+        print(json.dumps(stats, indent=2))
+    else:
+        print(format_stats(stats))
+
+
+def _run_incremental(args):
+    from apex_skus.incremental import regenerate
+    from apex_skus.registry import get_series
+
+    report = regenerate(args.series, args.output_dir, args.workers, args.chunk_size, force=args.force)
+    for name, result in report["generated"].items():
+        print(f"Successfully generated {result['rows']} {get_series(name).label} SKUs "
+              f"in {result['seconds']:.2f}s")
+    if report["skipped"]:
+        print(f"Skipped unchanged series: {', '.join(report['skipped'])} "
+              f"(saved about {report['seconds_saved']:.2f}s)")
+
+
+def _run_availability(args):
+    from apex_skus.availability import compile_availability
+    from apex_skus.registry import resolve_series
+
+    matrices = [compile_availability(spec) for spec in resolve_series(args.series)]
+    if args.json:
+        print(json.dumps([matrix.to_dict() for matrix in matrices], indent=2))
+        return
+    for matrix in matrices:
+        print(f"{matrix.spec.label}:")
+        print(matrix.format_grid())
+        print()
+
+
+def _run_serve(args):
+    from apex_skus.server import serve
+
+    serve(args.host, args.port, args.unix, args.series)
+
+
+def _run_shards(args):
+    from apex_skus.registry import get_series
+    from apex_skus.shards import manifest_file_name, write_shards
+
+    manifests = write_shards(args.series, args.output_dir, args.compression, args.shard_by, args.shard_rows,
+                             args.workers, args.chunk_size)
+    for name, manifest in manifests.items():
+        spec = get_series(name)
+        print(f"Successfully generated {manifest['rows']} {spec.label} SKUs in {len(manifest['shards'])} "
+              f"shard(s) ({args.compression} compression) listed in '{manifest_file_name(spec)}'")
+
+
+def _run_instrumented(args):
+    from apex_skus.metrics import RunMetrics, load_hook
+    from apex_skus.registry import resolve_series
+
+    run_metrics = RunMetrics(load_hook(args.profile) if args.profile else None)
+    os.makedirs(args.output_dir, exist_ok=True)
+    for spec in resolve_series(args.series):
+        path = os.path.join(args.output_dir, spec.csv_file_name)
+        row_count = run_metrics.write_series_csv(spec, path, args.chunk_size)
+        print(f"Successfully generated {row_count} {spec.label} SKUs and saved to '{path}'")
+    run_metrics.save(args.metrics)
+
+
+def _run_watch(args):
+    from apex_skus.watch import SpecWatcher
+
+    SpecWatcher(args.series, args.output_dir, args.interval, args.debounce, args.workers, args.chunk_size).run()
+
+
+def _run_master(args):
+    from apex_skus.master import merge_catalog
+
+    report = merge_catalog(args.output, args.series, args.from_csv, args.run_rows, args.temp_dir, args.collisions)
+    print(f"Successfully merged {report['rows']} SKUs into '{args.output}' in {report['seconds']:.2f}s "
+          f"({report['duplicates']} duplicates dropped, {report['spilled_runs']} runs spilled to disk)")
+    if report["collisions"]:
+        print(f"Warning: {report['collisions']} SKUs appear in more than one series", file=sys.stderr)
+        for collision in report["collision_examples"]:
+            print(f"  {collision['SKU']}: kept {collision['Kept Series']}, "
+                  f"also in {collision['Colliding Series']}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _run_generate(args):
+    from apex_skus.parallel import generate_series
+    from apex_skus.registry import get_series
+
+    if args.incremental or args.force:
+        _run_incremental(args)
+        return
+    if args.compression != "none" or args.shard_by is not None:
+        _run_shards(args)
+        return
+    if args.metrics:
+        _run_instrumented(args)
+        return
+    results = generate_series(args.series, args.output_dir, args.workers, args.chunk_size)
+    for name, (path, row_count, _) in results.items():
+        print(f"Successfully generated {row_count} {get_series(name).label} SKUs and saved to '{path}'")
+
+
+def _check_generate_options(parser, args):
+    """
+    Rejects generate options that the selected output mode would ignore.
+    """
+    incremental = args.incremental or args.force
+    sharded = args.compression != "none" or args.shard_by is not None
+    if incremental and sharded:
+        parser.error("--incremental/--force write plain CSVs; they cannot be combined with "
+                     "--compression or --shard-by")
+    if args.profile and not args.metrics:
+        parser.error("--profile needs --metrics")
+    if args.metrics and (incremental or sharded):
+        parser.error("--metrics instruments plain CSV generation; it cannot be combined with "
+                     "--incremental, --force, --compression or --shard-by")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m apex_skus",
+                                     description="Apex Dynamics gearbox SKU catalog tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="write the CSV of each series, using a process pool")
+    _add_series_argument(generate)
+    generate.add_argument("--output-dir", default=".", help="directory for the CSV files (default: %(default)s)")
+    generate.add_argument("--workers", type=_positive_int, default=None,
+                          help="worker processes (default: CPU count; 1 generates in-process)")
+    generate.add_argument("--chunk-size", type=_positive_int, default=DEFAULT_CHUNK_SIZE,
+                          help="rows per work unit (default: %(default)s)")
+    generate.add_argument("--incremental", action="store_true",
+                          help="only regenerate series whose spec changed since the last incremental run")
+    generate.add_argument("--force", action="store_true",
+                          help="regenerate every series and refresh the incremental manifest")
+    generate.add_argument("--compression", choices=("none", "gzip", "zstd"), default="none",
+                          help="compress the output; zstd needs the zstandard package (default: %(default)s)")
+    generate.add_argument("--shard-by", choices=("rows", "size"),
+                          help="split each series into shards of --shard-rows rows or one per gearbox size, "
+                               "listed in a manifest")
+    generate.add_argument("--shard-rows", type=_positive_int, default=DEFAULT_SHARD_ROWS,
+                          help="rows per shard with --shard-by rows (default: %(default)s)")
+    generate.add_argument("--metrics", metavar="FILE",
+                          help="generate in-process and write per-series timings, rule counts, bytes and "
+                               "peak RSS as JSON to FILE ('-' for standard error)")
+    generate.add_argument("--profile", metavar="HOOK",
+                          help="with --metrics, wrap each series' enumeration loop in a profiler hook: "
+                               "'cprofile' or module:attribute")
+    generate.set_defaults(handler=_run_generate)
+
+    diff = commands.add_parser("diff", help="stream the SKUs added and removed between two spec versions")
+    _add_series_argument(diff)
+    diff.add_argument("old", type=_spec_source,
+                      help="old spec version: 'current', a series directory, a .py or a .json file")
+    diff.add_argument("new", type=_spec_source, help="new spec version, same forms as OLD")
+    diff.add_argument("--format", choices=("csv", "jsonl"), default="csv", help="output format (default: %(default)s)")
+    diff.add_argument("--output", help="write to this file instead of standard output")
+    diff.set_defaults(handler=_run_diff)
+
+    export = commands.add_parser("export", help="write the catalog as dictionary-encoded columns")
+    _add_series_argument(export)
+    export.add_argument("output", help="Parquet file, or directory for the npy layout")
+    export.add_argument("--format", choices=("auto", "parquet", "npy"), default="auto",
+                        help="parquet needs pyarrow; auto falls back to npy without it (default: %(default)s)")
+    export.add_argument("--chunk-size", type=_positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help="rows encoded at a time (default: %(default)s)")
+    export.set_defaults(handler=_run_export)
+
+    sqlite = commands.add_parser("sqlite", help="load or update an indexed SQLite catalog")
+    _add_series_argument(sqlite)
+    sqlite.add_argument("database", help="SQLite database file")
+    sqlite.add_argument("--full", action="store_true",
+                        help="bulk reload the series instead of applying only the changed rows")
+    sqlite.add_argument("--batch-size", type=_positive_int, default=DEFAULT_BATCH_SIZE,
+                        help="rows per executemany batch (default: %(default)s)")
+    sqlite.set_defaults(handler=_run_sqlite)
+
+    validate = commands.add_parser("validate", help="check an order file of SKUs, one per line")
+    _add_series_argument(validate)
+    validate.add_argument("input", help="order file with one SKU per line ('-' for standard input)")
+    validate.add_argument("--output", help="write the verdict CSV here instead of standard output")
+    validate.add_argument("--workers", type=_positive_int, default=None,
+                          help="worker processes (default: CPU count; 1 validates in-process)")
+    validate.add_argument("--chunk-lines", type=_positive_int, default=100000,
+                          help="lines per work unit (default: %(default)s)")
+    validate.set_defaults(handler=_run_validate)
+
+    stats = commands.add_parser("stats", help="exact SKU counts per series, size, stage and option")
+    _add_series_argument(stats)
+    stats.add_argument("--json", action="store_true", help="print the counts as JSON")
+    stats.set_defaults(handler=_run_stats)
+
+    availability = commands.add_parser("availability", help="show the compiled size x ratio availability matrix")
+    _add_series_argument(availability)
+    availability.add_argument("--json", action="store_true", help="print available ratios per size as JSON")
+    availability.set_defaults(handler=_run_availability)
+
+    serve = commands.add_parser("serve", help="answer validate, count, list and query requests over local HTTP")
+    _add_series_argument(serve)
+    serve.add_argument("--host", default="127.0.0.1", help="address to listen on (default: %(default)s)")
+    serve.add_argument("--port", type=int, default=8765, help="TCP port; 0 picks a free one (default: %(default)s)")
+    serve.add_argument("--unix", metavar="PATH", help="listen on this Unix socket instead of TCP")
+    serve.set_defaults(handler=_run_serve)
+
+    master = commands.add_parser("master", help="merge the series into one deduplicated catalog sorted by SKU")
+    _add_series_argument(master)
+    master.add_argument("output", nargs="?", default="apex_dynamics_master_skus.csv",
+                        help="master CSV to write (default: %(default)s)")
+    master.add_argument("--from-csv", nargs="+", metavar="CSV",
+                        help="merge these per-series CSV files instead of generating the series")
+    master.add_argument("--run-rows", type=_positive_int, default=1000000,
+                        help="rows sorted in memory at a time; larger inputs spill to disk (default: %(default)s)")
+    master.add_argument("--temp-dir", help="directory for spilled runs (default: the system temporary directory)")
+    master.add_argument("--collisions", metavar="FILE",
+                        help="write every SKU found in more than one series to this CSV")
+    master.set_defaults(handler=_run_master)
+
+    watch = commands.add_parser("watch", help="regenerate series in-process whenever their definition files change")
+    _add_series_argument(watch)
+    watch.add_argument("--output-dir", default=".", help="directory for the CSV files (default: %(default)s)")
+    watch.add_argument("--interval", type=float, default=0.2, help="seconds between polls (default: %(default)s)")
+    watch.add_argument("--debounce", type=float, default=0.3,
+                       help="seconds a change must be quiet before rebuilding (default: %(default)s)")
+    watch.add_argument("--workers", type=_positive_int, default=1,
+                       help="worker processes per rebuild (default: %(default)s)")
+    watch.add_argument("--chunk-size", type=_positive_int, default=DEFAULT_CHUNK_SIZE,
+                       help="rows per work unit (default: %(default)s)")
+    watch.set_defaults(handler=_run_watch)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "generate":
+        _check_generate_options(parser, args)
+    return args.handler(args)
@@ -0,0 +1,101 @@
+import random
+from bisect import bisect_right
+
+import numpy as np
+
+from apex_skus.engine import SeriesGrid
+from apex_skus.parsing import InvalidSkuError, SkuParser, SkuParts
+from apex_skus.registry import resolve_series
+
+__all__ = ["SkuCodec", "InvalidSkuError", "SkuParts"]
+
+
+class SkuCodec:
+    """
+    Bijective mapping between the valid SKUs of a set of series and the dense
+    integer IDs 0..len(codec)-1.
+
+    IDs follow catalog order: series in registry order, then the row order of
+    each series CSV, so ID n is row n of the concatenated catalogs. rank() and
+    unrank() are constant time per SKU; unavailable combinations are skipped via
+    a prefix count over each series' availability mask rather than by listing
+    the catalog.
+    """
+
+    def __init__(self, specs=None):
+        """
+        specs is a list of series names or SeriesSpecs; defaults to every series.
+        """
+        self.specs = resolve_series(specs)
+        self.parser = SkuParser(self.specs)
+        self._offsets = []
+        self._size_lookup = {}
+        self._tables = []
+        total = 0
+        for series_idx, spec in enumerate(self.specs):
+            grid = SeriesGrid(spec)
+            flat_mask = grid.mask.ravel()
+            # Rank of each available (size, ratio) pair among the available pairs; -1 if excluded
+            pair_rank = np.where(flat_mask, np.cumsum(flat_mask) - 1, -1)
+            self._tables.append({
+                "ratio_index": {ratio: j for j, ratio in enumerate(spec.ratios)},
+                "ratio_labels": [f"{ratio:03d}" for ratio in spec.ratios],
+                "shaft_index": {shaft: k for k, shaft in enumerate(spec.shaft_options or ())},
+                "backlash_index": {backlash: k for k, backlash in enumerate(spec.backlash_options)},
+                "pair_rank": pair_rank.tolist(),
+                "pair_flat": np.flatnonzero(flat_mask).tolist(),
+                "ratio_count": len(spec.ratios),
+                "backlash_count": grid.backlash_count,
+                "options_per_pair": grid.options_per_pair,
+            })
+            for size_idx, size in enumerate(spec.sizes):
+                self._size_lookup[size] = (series_idx, size_idx)
+            self._offsets.append(total)
+            total += grid.row_count
+        self._total = total
+
+    def __len__(self):
+        return self._total
+
+    def parse(self, sku):
+        """
+        Splits an ordering code into SkuParts; see SkuParser.parse.
+        """
+        return self.parser.parse(sku)
+
+    def rank(self, sku):
+        """
+        Returns the integer ID of a valid SKU string.
+        """
+        parts = self.parser.check(sku)
+        series_idx, size_idx = self._size_lookup[parts.size]
+        table = self._tables[series_idx]
+        ratio_idx = table["ratio_index"][parts.ratio]
+        pair = table["pair_rank"][size_idx * table["ratio_count"] + ratio_idx]
+        shaft_idx = 0 if parts.shaft is None else table["shaft_index"][parts.shaft]
+        option = shaft_idx * table["backlash_count"] + table["backlash_index"][parts.backlash]
+        return self._offsets[series_idx] + pair * table["options_per_pair"] + option
+
+    def unrank(self, sku_id):
+        """
+        Returns the SKU string with the given integer ID.
+        """
+        if not 0 <= sku_id < self._total:
+            raise IndexError(f"SKU ID {sku_id} out of range 0..{self._total - 1}")
+        series_idx = bisect_right(self._offsets, sku_id) - 1
+        spec = self.specs[series_idx]
+        table = self._tables[series_idx]
+        pair, option = divmod(sku_id - self._offsets[series_idx], table["options_per_pair"])
+        shaft_idx, backlash_idx = divmod(option, table["backlash_count"])
+        size_idx, ratio_idx = divmod(table["pair_flat"][pair], table["ratio_count"])
+        prefix = f"{spec.sizes[size_idx]}-{table['ratio_labels'][ratio_idx]}"
+        if spec.has_shaft:
+            prefix = f"{prefix}-{spec.shaft_options[shaft_idx]}"
+        return f"{prefix}-{spec.backlash_options[backlash_idx]}"
+
+    def sample(self, count, seed=None):
+        """
+        Draws count distinct SKUs uniformly at random from all valid SKUs.
+        """
+        rng = random.Random(seed)
+        return [self.unrank(sku_id) for sku_id in rng.sample(range(self._total), count)]
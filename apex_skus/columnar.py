@@ -0,0 +1,301 @@
+import json
+import os
+
+import numpy as np
+
+from apex_skus.engine import SeriesGrid
+from apex_skus.registry import resolve_series
+from apex_skus.stream import DEFAULT_CHUNK_SIZE
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional
+    pa = None
+    pq = None
+
+# Dictionary-encoded columns, in CSV column order; the SKU is derived from them
+CODE_COLUMNS = ("series", "size", "ratio", "shaft", "backlash")
+
+DICTIONARIES_FILE = "dictionaries.json"
+
+
+def _code_dtype(dictionary_size):
+    """
+    Smallest unsigned integer type that can index a dictionary.
+    """
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if dictionary_size <= np.iinfo(dtype).max + 1:
+            return dtype
+    return np.uint64
+
+
+class CatalogEncoding:
+    """
+    Catalog-wide dictionaries for the coded columns of a set of series, and the
+    per-series lookup tables that turn engine indices into dictionary codes.
+    """
+
+    def __init__(self, specs):
+        self.specs = specs
+        self.dictionaries = {column: [] for column in CODE_COLUMNS}
+        positions = {column: {} for column in CODE_COLUMNS}
+
+        def code_of(column, value):
+            table = positions[column]
+            if value not in table:
+                table[value] = len(self.dictionaries[column])
+                self.dictionaries[column].append(value)
+            return table[value]
+
+        # Ratios sort numerically, so code order matches ratio order
+        for ratio in sorted({ratio for spec in specs for ratio in spec.ratios}):
+            code_of("ratio", f"{ratio:03d}")
+
+        self.lookups = []
+        for spec in specs:
+            self.lookups.append({
+                "series": code_of("series", spec.label),
+                "size": np.array([code_of("size", size) for size in spec.sizes], dtype=np.intp),
+                "ratio": np.array([code_of("ratio", f"{ratio:03d}") for ratio in spec.ratios], dtype=np.intp),
+                "shaft": np.array([code_of("shaft", shaft) for shaft in (spec.shaft_options or ("N/A",))],
+                                  dtype=np.intp),
+                "backlash": np.array([code_of("backlash", backlash) for backlash in spec.backlash_options],
+                                     dtype=np.intp),
+            })
+        self.dtypes = {column: _code_dtype(len(values)) for column, values in self.dictionaries.items()}
+
+    def iter_code_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Yields (series index, {column: codes}) for consecutive slices of the
+        catalog, in catalog order.
+        """
+        for series_idx, spec in enumerate(self.specs):
+            lookup = self.lookups[series_idx]
+            grid = SeriesGrid(spec)
+            for start in range(0, grid.row_count, chunk_size):
+                size_idx, ratio_idx, shaft_idx, backlash_idx = grid.indices(start, start + chunk_size)
+                codes = {
+                    "series": np.full(len(size_idx), lookup["series"], dtype=self.dtypes["series"]),
+                    "size": lookup["size"][size_idx].astype(self.dtypes["size"]),
+                    "ratio": lookup["ratio"][ratio_idx].astype(self.dtypes["ratio"]),
+                    "shaft": lookup["shaft"][shaft_idx].astype(self.dtypes["shaft"]),
+                    "backlash": lookup["backlash"][backlash_idx].astype(self.dtypes["backlash"]),
+                }
+                yield series_idx, codes
+
+
+def write_npy_catalog(path, series=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes the catalog as a directory of memory-mappable .npy code columns
+    (one per CODE_COLUMNS entry) plus dictionaries.json. Columns are filled
+    slice by slice through np.lib.format.open_memmap, so memory stays flat.
+    Returns the number of rows written.
+    """
+    specs = resolve_series(series)
+    encoding = CatalogEncoding(specs)
+    row_count = sum(SeriesGrid(spec).row_count for spec in specs)
+    os.makedirs(path, exist_ok=True)
+    columns = {
+        column: np.lib.format.open_memmap(os.path.join(path, f"{column}.npy"), mode="w+",
+                                          dtype=encoding.dtypes[column], shape=(row_count,))
+        for column in CODE_COLUMNS
+    }
+    offset = 0
+    for _, codes in encoding.iter_code_chunks(chunk_size):
+        stop = offset + len(codes["size"])
+        for column in CODE_COLUMNS:
+            columns[column][offset:stop] = codes[column]
+        offset = stop
+    for column in columns.values():
+        column.flush()
+    del columns
+    with open(os.path.join(path, DICTIONARIES_FILE), "w") as dictionaries_file:
+        json.dump({"rows": row_count, "dictionaries": encoding.dictionaries}, dictionaries_file, indent=2)
+    return row_count
+
+
+def write_parquet_catalog(path, series=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes the catalog as a Parquet file whose coded columns are Arrow
+    dictionary arrays, plus a plain "sku" string column. Requires pyarrow.
+    Returns the number of rows written.
+    """
+    if pa is None:
+        raise RuntimeError("Parquet output requires pyarrow; use the npy format instead")
+    specs = resolve_series(series)
+    encoding = CatalogEncoding(specs)
+    dictionaries = {column: pa.array(values, type=pa.string())
+                    for column, values in encoding.dictionaries.items()}
+    arrow_types = {np.uint8: pa.uint8(), np.uint16: pa.uint16(), np.uint32: pa.uint32(), np.uint64: pa.uint64()}
+    schema = pa.schema([pa.field(column, pa.dictionary(arrow_types[encoding.dtypes[column]], pa.string()))
+                        for column in CODE_COLUMNS] + [pa.field("sku", pa.string())])
+    row_count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for series_idx, codes in encoding.iter_code_chunks(chunk_size):
+            arrays = [pa.DictionaryArray.from_arrays(codes[column], dictionaries[column])
+                      for column in CODE_COLUMNS]
+            skus = decode_skus(encoding.specs[series_idx], encoding.dictionaries, codes)
+            writer.write_batch(pa.record_batch(arrays + [pa.array(skus, type=pa.string())], schema=schema))
+            row_count += len(skus)
+    return row_count
+
+
+def decode_skus(spec, dictionaries, codes):
+    """
+    Builds SKU strings for a slice of coded rows of one series.
+    """
+    parts = {column: np.array(dictionaries[column], dtype=object)[codes[column]]
+             for column in ("size", "ratio", "shaft", "backlash")}
+    if spec.has_shaft:
+        skus = parts["size"] + "-" + parts["ratio"] + "-" + parts["shaft"] + "-" + parts["backlash"]
+    else:
+        skus = parts["size"] + "-" + parts["ratio"] + "-" + parts["backlash"]
+    return skus.tolist()
+
+
+def write_columnar(path, series=None, output_format="auto", chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes the catalog in a columnar format: "parquet", "npy", or "auto"
+    (Parquet when pyarrow is installed, the NumPy layout otherwise).
+    Returns (format used, row count).
+    """
+    if output_format == "auto":
+        output_format = "parquet" if pa is not None else "npy"
+    if output_format == "parquet":
+        return output_format, write_parquet_catalog(path, series, chunk_size)
+    if output_format == "npy":
+        return output_format, write_npy_catalog(path, series, chunk_size)
+    raise ValueError(f"Unknown columnar format '{output_format}'; expected auto, parquet or npy")
+
+
+class _CodedCatalog:
+    """
+    Row access shared by the catalogs held as dictionary-encoded code columns;
+    subclasses set row_count, dictionaries and columns ({column: code array}).
+    """
+
+    def _init_codes(self):
+        self._codes = {column: {value: code for code, value in enumerate(values)}
+                       for column, values in self.dictionaries.items()}
+        self._labels = {column: np.array(values, dtype=object) for column, values in self.dictionaries.items()}
+
+    def __len__(self):
+        return self.row_count
+
+    def _code(self, column, value):
+        if column == "series" and not str(value).endswith(" Series"):
+            value = f"{str(value).upper()} Series"
+        elif column == "ratio" and isinstance(value, int):
+            value = f"{value:03d}"
+        return self._codes[column].get(value, -1)
+
+    def mask(self, **filters):
+        """
+        Boolean row mask for equality filters on coded columns, e.g.
+        mask(series="ADR", ratio=40, backlash="P1"). A filter value may also be
+        a list of accepted values.
+        """
+        result = np.ones(self.row_count, dtype=bool)
+        for column, value in filters.items():
+            if column not in self.columns:
+                raise KeyError(f"Unknown column '{column}'; expected one of {', '.join(CODE_COLUMNS)}")
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            codes = [self._code(column, item) for item in values]
+            result &= np.isin(self.columns[column], codes)
+        return result
+
+    def decode(self, column, rows=None):
+        """
+        Column values (labels, not codes) for the selected rows (all by default).
+        """
+        codes = self.columns[column] if rows is None else self.columns[column][rows]
+        return self._labels[column][codes]
+
+    def rows(self, rows=None):
+        """
+        CSV-style rows (Series, Gearbox Size, Ratio, Shaft Option, Backlash, SKU)
+        for the selected rows, e.g. catalog.rows(catalog.mask(series="AB")).
+        """
+        decoded = [self.decode(column, rows) for column in CODE_COLUMNS]
+        series, size, ratio, shaft, backlash = decoded
+        with_shaft = size + "-" + ratio + "-" + shaft + "-" + backlash
+        without_shaft = size + "-" + ratio + "-" + backlash
+        skus = np.where(shaft == "N/A", without_shaft, with_shaft)
+        return np.column_stack(decoded + [skus]).tolist()
+
+
+class ColumnarCatalog(_CodedCatalog):
+    """
+    Read-only view of a catalog written by write_npy_catalog. Code columns are
+    memory-mapped, so filtering touches only the columns involved and never
+    parses text.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, DICTIONARIES_FILE)) as dictionaries_file:
+            metadata = json.load(dictionaries_file)
+        self.row_count = metadata["rows"]
+        self.dictionaries = metadata["dictionaries"]
+        self._init_codes()
+        self.columns = {column: np.load(os.path.join(path, f"{column}.npy"), mmap_mode="r")
+                        for column in CODE_COLUMNS}
+
+
+class CompactCatalog(_CodedCatalog):
+    """
+    The catalog held in memory as one small unsigned code per column and row
+    (usually a single byte) into catalog-wide dictionaries of interned labels,
+    instead of a six-string list per row. Series labels, sizes, formatted
+    ratios and option codes are stored once; rows and SKU strings are built
+    only when asked for.
+    """
+
+    def __init__(self, series=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        specs = resolve_series(series)
+        encoding = CatalogEncoding(specs)
+        self.specs = specs
+        self.dictionaries = encoding.dictionaries
+        self.row_count = sum(SeriesGrid(spec).row_count for spec in specs)
+        self.columns = {column: np.empty(self.row_count, dtype=encoding.dtypes[column])
+                        for column in CODE_COLUMNS}
+        offset = 0
+        for _, codes in encoding.iter_code_chunks(chunk_size):
+            stop = offset + len(codes["size"])
+            for column in CODE_COLUMNS:
+                self.columns[column][offset:stop] = codes[column]
+            offset = stop
+        self._init_codes()
+
+    @property
+    def nbytes(self):
+        """
+        Bytes held by the code columns (the dictionaries add a few KiB).
+        """
+        return sum(column.nbytes for column in self.columns.values())
+
+    def __getitem__(self, index):
+        """
+        The CSV-style row at index, built from the dictionaries.
+        """
+        labels = [self.dictionaries[column][self.columns[column][index]] for column in CODE_COLUMNS]
+        return labels + [self._sku(labels)]
+
+    @staticmethod
+    def _sku(labels):
+        _, size, ratio, shaft, backlash = labels
+        return f"{size}-{ratio}-{backlash}" if shaft == "N/A" else f"{size}-{ratio}-{shaft}-{backlash}"
+
+    def sku(self, index):
+        """
+        The SKU string of one row.
+        """
+        return self._sku([self.dictionaries[column][self.columns[column][index]] for column in CODE_COLUMNS])
+
+    def iter_rows(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Yields every row in catalog order, decoding chunk_size rows at a time.
+        """
+        for start in range(0, self.row_count, chunk_size):
+            yield from self.rows(slice(start, start + chunk_size))
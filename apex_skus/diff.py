@@ -0,0 +1,96 @@
+import csv
+import json
+from collections import namedtuple
+
+from apex_skus.availability import compile_availability
+
+# One added or removed SKU; shaft is "N/A" for series without a shaft segment
+DiffRecord = namedtuple("DiffRecord", ["change", "series", "size", "ratio", "shaft", "backlash", "sku"])
+
+DIFF_CSV_HEADER = ["Change", "Series", "Gearbox Size", "Ratio", "Shaft Option", "Backlash", "SKU"]
+
+
+def _options(spec):
+    """
+    The (shaft, backlash) fan-out of every available pair, in catalog order.
+    """
+    shafts = spec.shaft_options if spec.has_shaft else (None,)
+    return [(shaft, backlash) for shaft in shafts for backlash in spec.backlash_options]
+
+
+def _pair_options(spec, matrix, size, ratio, options):
+    if spec is None or not matrix.is_available(size, ratio):
+        return []
+    return options
+
+
+def iter_series_diff(old_spec, new_spec):
+    """
+    Yields DiffRecords for one series between two versions of its spec; either
+    side may be None when the series was added or dropped.
+
+    Works on the availability matrices: for every (size, ratio) pair known to
+    either version, the option sets available before and after are compared,
+    so no catalog is enumerated and memory does not grow with catalog size.
+    Pairs are visited in new catalog order (sizes of the new spec first, then
+    dropped sizes), ratios ascending; removals come before additions per pair.
+    """
+    specs = [spec for spec in (new_spec, old_spec) if spec is not None]
+    label = specs[0].label
+    old_matrix = compile_availability(old_spec) if old_spec is not None else None
+    new_matrix = compile_availability(new_spec) if new_spec is not None else None
+    old_options = _options(old_spec) if old_spec is not None else []
+    new_options = _options(new_spec) if new_spec is not None else []
+
+    sizes = list(dict.fromkeys(size for spec in specs for size in spec.sizes))
+    ratios = sorted({ratio for spec in specs for ratio in spec.ratios})
+    for size in sizes:
+        for ratio in ratios:
+            before = _pair_options(old_spec, old_matrix, size, ratio, old_options)
+            after = _pair_options(new_spec, new_matrix, size, ratio, new_options)
+            if before == after:
+                continue
+            after_set, before_set = set(after), set(before)
+            changes = ([("removed", option) for option in before if option not in after_set]
+                       + [("added", option) for option in after if option not in before_set])
+            for change, (shaft, backlash) in changes:
+                formatted_ratio = f"{ratio:03d}"
+                if shaft is None:
+                    sku = f"{size}-{formatted_ratio}-{backlash}"
+                else:
+                    sku = f"{size}-{formatted_ratio}-{shaft}-{backlash}"
+                yield DiffRecord(change, label, size, formatted_ratio, shaft or "N/A", backlash, sku)
+
+
+def iter_catalog_diff(old_specs, new_specs, series=None):
+    """
+    Yields DiffRecords for every series in either version ({name: SeriesSpec}
+    mappings, e.g. from registry.load_specs), or only the named series.
+    """
+    names = list(dict.fromkeys(list(new_specs) + list(old_specs)))
+    if series is not None:
+        wanted = {name.upper() for name in series}
+        names = [name for name in names if name in wanted]
+    for name in names:
+        yield from iter_series_diff(old_specs.get(name), new_specs.get(name))
+
+
+def write_diff(records, out, output_format="csv"):
+    """
+    Streams DiffRecords to a text file object as CSV or JSON lines and returns
+    {"added": n, "removed": n}.
+    """
+    counts = {"added": 0, "removed": 0}
+    if output_format == "csv":
+        csv_writer = csv.writer(out)
+        csv_writer.writerow(DIFF_CSV_HEADER)
+        for record in records:
+            csv_writer.writerow(record)
+            counts[record.change] += 1
+    elif output_format == "jsonl":
+        for record in records:
+            out.write(json.dumps(record._asdict()) + "\n")
+            counts[record.change] += 1
+    else:
+        raise ValueError(f"Unknown diff format '{output_format}'; expected csv or jsonl")
+    return counts
@@ -0,0 +1,128 @@
+import numpy as np
+
+from apex_skus.availability import compile_availability
+from apex_skus.stream import DEFAULT_CHUNK_SIZE
+
+
+def availability_mask(spec):
+    """
+    Boolean (size, ratio) matrix that is True for every orderable pair.
+    """
+    return compile_availability(spec).to_array()
+
+
+def exclusion_mask(spec):
+    """
+    Boolean (size, ratio) matrix that is True wherever an exclusion rule applies.
+    """
+    return ~availability_mask(spec)
+
+
+def option_count(spec):
+    """
+    Number of shaft x backlash combinations per available (size, ratio) pair.
+    """
+    shafts = len(spec.shaft_options) if spec.has_shaft else 1
+    return shafts * len(spec.backlash_options)
+
+
+def row_count(spec):
+    """
+    Number of SKUs in a series.
+    """
+    return compile_availability(spec).pair_count() * option_count(spec)
+
+
+class SeriesGrid:
+    """
+    Index form of a series catalog: the available (size, ratio) pairs plus the
+    option fan-out, from which any slice of rows can be built with array ops.
+
+    The optional selections restrict the grid before anything is expanded:
+    size_select and ratio_select are boolean vectors over spec.sizes and
+    spec.ratios, shaft_select and backlash_select are index lists into
+    spec.shaft_options and spec.backlash_options.
+    """
+
+    def __init__(self, spec, size_select=None, ratio_select=None,
+                 shaft_select=None, backlash_select=None):
+        self.spec = spec
+        self.mask = availability_mask(spec)
+        if size_select is not None:
+            self.mask &= np.asarray(size_select, dtype=bool)[:, None]
+        if ratio_select is not None:
+            self.mask &= np.asarray(ratio_select, dtype=bool)[None, :]
+        # Row-major nonzero keeps the size-then-ratio order of the original loops
+        self.pair_sizes, self.pair_ratios = np.nonzero(self.mask)
+        shaft_total = len(spec.shaft_options) if spec.has_shaft else 1
+        self.shaft_choices = np.arange(shaft_total) if shaft_select is None else np.asarray(shaft_select, dtype=np.intp)
+        self.backlash_choices = (np.arange(len(spec.backlash_options)) if backlash_select is None
+                                 else np.asarray(backlash_select, dtype=np.intp))
+        self.shaft_count = len(self.shaft_choices)
+        self.backlash_count = len(self.backlash_choices)
+        self.options_per_pair = self.shaft_count * self.backlash_count
+        self.row_count = len(self.pair_sizes) * self.options_per_pair
+
+    def indices(self, start=0, stop=None):
+        """
+        Returns (size, ratio, shaft, backlash) index arrays for rows [start, stop).
+        """
+        stop = self.row_count if stop is None else min(stop, self.row_count)
+        rows = np.arange(start, stop)
+        pair, option = np.divmod(rows, max(self.options_per_pair, 1))
+        shaft, backlash = np.divmod(option, max(self.backlash_count, 1))
+        return (self.pair_sizes[pair], self.pair_ratios[pair],
+                self.shaft_choices[shaft], self.backlash_choices[backlash])
+
+    def rows(self, start=0, stop=None):
+        """
+        Returns the CSV rows [start, stop) as a list of lists.
+        """
+        return format_rows(self.spec, *self.indices(start, stop))
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Yields the series rows as lists of at most chunk_size rows.
+        """
+        for start in range(0, self.row_count, chunk_size):
+            yield self.rows(start, start + chunk_size)
+
+
+def format_rows(spec, size_idx, ratio_idx, shaft_idx, backlash_idx):
+    """
+    Builds CSV rows from index arrays. Label strings are looked up from small
+    per-column tables, so each distinct value is formatted once.
+    """
+    sizes = np.array(spec.sizes, dtype=object)[size_idx]
+    # Format ratio with leading zero if less than 100
+    ratios = np.array([f"{ratio:03d}" for ratio in spec.ratios], dtype=object)[ratio_idx]
+    backlashes = np.array(spec.backlash_options, dtype=object)[backlash_idx]
+    if spec.has_shaft:
+        shafts = np.array(spec.shaft_options, dtype=object)[shaft_idx]
+        skus = sizes + "-" + ratios + "-" + shafts + "-" + backlashes
+    else:
+        # Series without a shaft option leave it out of the ordering code
+        shafts = np.full(len(size_idx), "N/A", dtype=object)
+        skus = sizes + "-" + ratios + "-" + backlashes
+    labels = np.full(len(size_idx), spec.label, dtype=object)
+    return np.column_stack((labels, sizes, ratios, shafts, backlashes, skus)).tolist()
+
+
+def iter_rows(spec, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yields the rows of a series one by one, built chunk_size rows at a time.
+    """
+    for chunk in SeriesGrid(spec).iter_chunks(chunk_size):
+        yield from chunk
+
+
+def catalog_indices(specs):
+    """
+    Builds the whole catalog for several series in one pass as index arrays:
+    (series, size, ratio, shaft, backlash), with series indexing into specs.
+    """
+    grids = [SeriesGrid(spec) for spec in specs]
+    parts = [grid.indices() for grid in grids]
+    series = np.repeat(np.arange(len(grids)), [grid.row_count for grid in grids])
+    columns = [np.concatenate([part[k] for part in parts]) for k in range(4)]
+    return (series, *columns)
@@ -0,0 +1,90 @@
+import os
+
+from apex_skus.registry import get_series
+from apex_skus.stream import DEFAULT_CHUNK_SIZE, DEFAULT_SHARD_ROWS, write_series_csv
+
+
+def _generate(series_names, chunk_size, compression="none", shard_by=None, shard_rows=DEFAULT_SHARD_ROWS):
+    """
+    Writes each series to its CSV in the current directory, chunk_size rows
+    at a time. compression ("none", "gzip" or "zstd") and shard_by ("rows",
+    in files of shard_rows rows, or "size") write compressed shards plus a
+    manifest per series instead; see apex_skus.shards.write_shards. Setting
+    APEX_SKUS_METRICS instruments the plain CSV output and cannot be combined
+    with shards; see apex_skus.metrics.
+    """
+    if compression != "none" or shard_by is not None:
+        if os.environ.get("APEX_SKUS_METRICS"):
+            raise ValueError("APEX_SKUS_METRICS instruments plain CSV output; unset it to write shards")
+        from apex_skus.shards import manifest_file_name, write_shards
+
+        manifests = write_shards(series_names, ".", compression, shard_by, shard_rows, chunk_size=chunk_size)
+        for series_name, manifest in manifests.items():
+            spec = get_series(series_name)
+            print(f"Successfully generated {manifest['rows']} {spec.label} SKUs in {len(manifest['shards'])} "
+                  f"shard(s) ({compression} compression) listed in '{manifest_file_name(spec)}'")
+        return
+    # APEX_SKUS_METRICS switches on instrumentation; see apex_skus.metrics
+    instrumented = None
+    if os.environ.get("APEX_SKUS_METRICS"):
+        from apex_skus.metrics import metrics_from_environment
+
+        instrumented = metrics_from_environment()
+    for series_name in series_names:
+        spec = get_series(series_name)
+        if instrumented is None:
+            sku_count = write_series_csv(spec, chunk_size=chunk_size)
+        else:
+            sku_count = instrumented[0].write_series_csv(spec, chunk_size=chunk_size)
+        print(f"Successfully generated {sku_count} {spec.label} SKUs and saved to '{spec.csv_file_name}'")
+    if instrumented is not None:
+        run_metrics, path = instrumented
+        run_metrics.save(path)
+
+
+def generate_apex_skus(chunk_size=DEFAULT_CHUNK_SIZE, compression="none", shard_by=None,
+                       shard_rows=DEFAULT_SHARD_ROWS):
+    """
+    Generates SKUs for Apex Dynamics AB and ABR series planetary gearboxes
+    based on the provided specifications, excluding unavailable combinations,
+    and saves them to separate CSV files (one for AB, one for ABR).
+    Rows are streamed to each CSV in chunks of chunk_size rows.
+    See _generate for the compression and sharding options.
+    """
+    _generate(["AB", "ABR"], chunk_size, compression, shard_by, shard_rows)
+
+
+def generate_apex_af_afr_skus(chunk_size=DEFAULT_CHUNK_SIZE, compression="none", shard_by=None,
+                              shard_rows=DEFAULT_SHARD_ROWS):
+    """
+    Generates SKUs for Apex Dynamics AF and AFR series planetary gearboxes
+    based on the provided specifications, excluding unavailable combinations,
+    and saves them to separate CSV files (one for AF, one for AFR).
+    Rows are streamed to each CSV in chunks of chunk_size rows.
+    See _generate for the compression and sharding options.
+    """
+    _generate(["AF", "AFR"], chunk_size, compression, shard_by, shard_rows)
+
+
+def generate_apex_afx_afxr_skus(chunk_size=DEFAULT_CHUNK_SIZE, compression="none", shard_by=None,
+                                shard_rows=DEFAULT_SHARD_ROWS):
+    """
+    Generates SKUs for Apex Dynamics AFX and AFXR series planetary gearboxes
+    based on the provided specifications, excluding unavailable combinations,
+    and saves them to separate CSV files (one for AFX, one for AFXR).
+    Rows are streamed to each CSV in chunks of chunk_size rows.
+    See _generate for the compression and sharding options.
+    """
+    _generate(["AFX", "AFXR"], chunk_size, compression, shard_by, shard_rows)
+
+
+def generate_apex_ad_adr_ads_skus(chunk_size=DEFAULT_CHUNK_SIZE, compression="none", shard_by=None,
+                                  shard_rows=DEFAULT_SHARD_ROWS):
+    """
+    Generates SKUs for Apex Dynamics AD, ADR, and ADS series planetary gearboxes
+    based on the provided specifications, excluding unavailable combinations,
+    and saves them to separate CSV files (one for AD, one for ADR, one for ADS).
+    Rows are streamed to each CSV in chunks of chunk_size rows.
+    See _generate for the compression and sharding options.
+    """
+    _generate(["AD", "ADR", "ADS"], chunk_size, compression, shard_by, shard_rows)
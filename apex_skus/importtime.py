@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+_SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def measure_import_time(module="apex_skus", runs=5):
+    """
+    Seconds a fresh interpreter takes to import module, as the best of `runs`
+    runs. Each run is a new process, so nothing is cached in sys.modules.
+    Intended for guarding startup cost, e.g. assert measure_import_time() < 0.05.
+    """
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", _SNIPPET.format(module=module)],
+                                check=True, capture_output=True, text=True).stdout
+        timings.append(float(output))
+    return min(timings)
+
+
+def imported_modules(module="apex_skus"):
+    """
+    Names of the modules a fresh interpreter loads beyond its own startup set
+    when importing module; useful to check that nothing heavy (e.g. numpy) is
+    pulled in eagerly.
+    """
+    snippet = (f"import sys; before = set(sys.modules); import {module}; "
+               "print('\\n'.join(sorted(set(sys.modules) - before)))")
+    output = subprocess.run([sys.executable, "-c", snippet],
+                            check=True, capture_output=True, text=True).stdout
+    return output.split()
+
+
+if __name__ == "__main__":
+    print(f"import apex_skus: {measure_import_time() * 1000:.2f} ms")
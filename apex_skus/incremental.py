@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import time
+
+from apex_skus.parallel import generate_series
+from apex_skus.registry import resolve_series
+from apex_skus.stream import CSV_HEADER, DEFAULT_CHUNK_SIZE, atomic_open
+
+MANIFEST_FILE_NAME = ".apex_skus_manifest.json"
+
+# Bump when the CSV layout changes in a way the spec does not capture, so
+# every series is regenerated once
+OUTPUT_FORMAT_VERSION = 1
+
+
+def spec_fingerprint(spec):
+    """
+    SHA-256 of everything that determines a series CSV: the spec (sizes, ratio
+    lists, options, exclusions), the CSV header and the output format version.
+    """
+    payload = json.dumps({
+        "format": OUTPUT_FORMAT_VERSION,
+        "header": CSV_HEADER,
+        "spec": spec.to_dict(),
+    }, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_manifest(output_dir):
+    """
+    Returns the manifest stored in output_dir, or an empty one.
+    """
+    path = os.path.join(output_dir, MANIFEST_FILE_NAME)
+    if not os.path.exists(path):
+        return {"series": {}}
+    with open(path) as manifest_file:
+        return json.load(manifest_file)
+
+
+def save_manifest(output_dir, manifest):
+    with atomic_open(os.path.join(output_dir, MANIFEST_FILE_NAME)) as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+
+def _file_state(path):
+    """
+    (size, st_mtime_ns) of a file, or None if it does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def regenerate(series=None, output_dir=".", workers=1, chunk_size=DEFAULT_CHUNK_SIZE, force=False):
+    """
+    Regenerates only the series whose fingerprint differs from the one recorded
+    in output_dir's manifest, or whose CSV is missing or was rewritten since
+    (its size or mtime differs from the recorded ones, e.g. after a plain
+    generate into the same directory); force regenerates all. Files are
+    replaced atomically (temporary file + rename) and the manifest is updated
+    afterwards.
+
+    Returns a report: {"generated": {name: {"rows", "seconds"}},
+    "skipped": [names], "seconds": total run time, "seconds_saved": the time
+    the skipped series took when they were last generated}.
+    """
+    started = time.perf_counter()
+    specs = resolve_series(series)
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    entries = manifest["series"]
+
+    stale, skipped, fingerprints = [], [], {}
+    for spec in specs:
+        fingerprints[spec.name] = spec_fingerprint(spec)
+        entry = entries.get(spec.name)
+        up_to_date = (entry is not None and entry["fingerprint"] == fingerprints[spec.name]
+                      and entry.get("state") == _file_state(os.path.join(output_dir, entry["file"])))
+        if up_to_date and not force:
+            skipped.append(spec.name)
+        else:
+            stale.append(spec)
+
+    generated = {}
+    if stale:
+        for name, (path, row_count, seconds) in generate_series(stale, output_dir, workers, chunk_size).items():
+            entries[name] = {
+                "fingerprint": fingerprints[name],
+                "file": os.path.basename(path),
+                "state": _file_state(path),
+                "rows": row_count,
+                "seconds": seconds,
+            }
+            generated[name] = {"rows": row_count, "seconds": seconds}
+        save_manifest(output_dir, manifest)
+
+    return {
+        "generated": generated,
+        "skipped": skipped,
+        "seconds": time.perf_counter() - started,
+        "seconds_saved": sum(entries[name]["seconds"] for name in skipped),
+    }
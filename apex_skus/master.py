@@ -0,0 +1,163 @@
+import csv
+import heapq
+import os
+import tempfile
+import time
+from contextlib import nullcontext
+from itertools import count
+
+from apex_skus.engine import SeriesGrid
+from apex_skus.registry import resolve_series
+from apex_skus.stream import CSV_HEADER, DEFAULT_CHUNK_SIZE, atomic_open
+
+MASTER_FILE_NAME = "apex_dynamics_master_skus.csv"
+
+# Rows sorted in memory at a time; more input is spilled to disk as sorted runs
+DEFAULT_RUN_ROWS = 1000000
+
+# Runs merged at once; more runs are first merged in passes of this many, so
+# the number of open files stays bounded
+MAX_MERGE_FAN_IN = 128
+
+COLLISION_CSV_HEADER = ["SKU", "Kept Series", "Colliding Series"]
+
+# Collisions kept in the returned report; all of them go to the collision file
+_COLLISION_EXAMPLES = 20
+
+
+def _series_rows(series, chunk_size):
+    for spec in resolve_series(series):
+        for chunk in SeriesGrid(spec).iter_chunks(chunk_size):
+            yield from chunk
+
+
+def _csv_rows(paths):
+    for path in paths:
+        with open(path, newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header != CSV_HEADER:
+                raise ValueError(f"'{path}' is not a SKU CSV: expected the header {','.join(CSV_HEADER)}")
+            yield from reader
+
+
+def _write_run(rows, directory, run_ids):
+    path = os.path.join(directory, f"run-{next(run_ids):06d}.csv")
+    with open(path, 'w', newline='') as run_file:
+        csv.writer(run_file).writerows(rows)
+    return path
+
+
+def _read_run(path):
+    with open(path, newline='') as run_file:
+        yield from csv.reader(run_file)
+
+
+def _sorted_runs(rows, key, run_rows, directory):
+    """
+    External sort, first phase: sorts rows run_rows at a time. Returns (sorted
+    iterables to merge, number of runs spilled to disk). Input that fits in
+    one run stays in memory; otherwise every run is spilled, and runs beyond
+    MAX_MERGE_FAN_IN are merged in intermediate passes.
+    """
+    run_ids = count()
+    buffer = []
+    paths = []
+    for row in rows:
+        buffer.append(row)
+        if len(buffer) >= run_rows:
+            buffer.sort(key=key)
+            paths.append(_write_run(buffer, directory, run_ids))
+            buffer = []
+    buffer.sort(key=key)
+    if not paths:
+        return [buffer], 0
+    if buffer:
+        paths.append(_write_run(buffer, directory, run_ids))
+    spilled = len(paths)
+    while len(paths) > MAX_MERGE_FAN_IN:
+        merged = []
+        for start in range(0, len(paths), MAX_MERGE_FAN_IN):
+            group = paths[start:start + MAX_MERGE_FAN_IN]
+            merged.append(_write_run(heapq.merge(*map(_read_run, group), key=key), directory, run_ids))
+            for path in group:
+                os.remove(path)
+        paths = merged
+    return [_read_run(path) for path in paths], spilled
+
+
+def merge_catalog(output=MASTER_FILE_NAME, series=None, csv_files=None, run_rows=DEFAULT_RUN_ROWS,
+                  temp_dir=None, collisions_path=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes one deduplicated master catalog of several series, sorted by SKU,
+    to output (atomically). The rows come from the engine for the requested
+    series (every series by default) or, when csv_files is given, from
+    per-series CSV files.
+
+    The merge is an external sort: rows are sorted run_rows at a time, runs
+    are spilled to temporary files (in temp_dir, default the system one) when
+    the input does not fit in one run, and all runs are combined with a k-way
+    heap merge, so memory stays bounded by run_rows whatever the catalog size.
+
+    Rows with equal SKUs are adjacent after the merge. A repeat within one
+    series is dropped as a duplicate. The same SKU in two series is a
+    collision: the row of the series listed first is kept, and each collision
+    is written to collisions_path (if given) as SKU, kept series, colliding
+    series. Returns a report with row, duplicate and collision counts, the
+    first collisions, the number of spilled runs and the run time.
+    """
+    started = time.perf_counter()
+    rows = _csv_rows(csv_files) if csv_files else _series_rows(series, chunk_size)
+    # Rank each series by first appearance, so SKU ties keep input order
+    rank = {}
+
+    def ranked(rows):
+        for row in rows:
+            if row[0] not in rank:
+                rank[row[0]] = len(rank)
+            yield row
+
+    def key(row):
+        return row[5], rank[row[0]]
+
+    report = {"input_rows": 0, "rows": 0, "duplicates": 0, "collisions": 0, "collision_examples": []}
+    with tempfile.TemporaryDirectory(prefix="apex_skus_master_", dir=temp_dir) as directory:
+        runs, report["spilled_runs"] = _sorted_runs(ranked(rows), key, run_rows, directory)
+        collision_file = open(collisions_path, 'w', newline='') if collisions_path else nullcontext()
+        with atomic_open(output) as csvfile, collision_file:
+            csv_writer = csv.writer(csvfile)
+            csv_writer.writerow(CSV_HEADER)
+            collision_writer = None
+            if collisions_path:
+                collision_writer = csv.writer(collision_file)
+                collision_writer.writerow(COLLISION_CSV_HEADER)
+            kept = None
+            # Series already seen for the current SKU, so a repeat is recognized
+            # even after a colliding row of another series came between
+            seen_series = set()
+            pending = []
+            for row in heapq.merge(*runs, key=key):
+                report["input_rows"] += 1
+                if kept is not None and row[5] == kept[5]:
+                    if row[0] in seen_series:
+                        report["duplicates"] += 1
+                        continue
+                    seen_series.add(row[0])
+                    collision = [row[5], kept[0], row[0]]
+                    report["collisions"] += 1
+                    if len(report["collision_examples"]) < _COLLISION_EXAMPLES:
+                        report["collision_examples"].append(dict(zip(COLLISION_CSV_HEADER, collision)))
+                    if collision_writer is not None:
+                        collision_writer.writerow(collision)
+                    continue
+                kept = row
+                seen_series = {row[0]}
+                pending.append(row)
+                if len(pending) >= chunk_size:
+                    csv_writer.writerows(pending)
+                    report["rows"] += len(pending)
+                    pending = []
+            csv_writer.writerows(pending)
+            report["rows"] += len(pending)
+    report["seconds"] = time.perf_counter() - started
+    return report
@@ -0,0 +1,223 @@
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from importlib import import_module
+
+from apex_skus.availability import compile_availability
+from apex_skus.engine import SeriesGrid, format_rows
+from apex_skus.stats import series_stats
+from apex_skus.stream import CSV_HEADER, DEFAULT_CHUNK_SIZE, atomic_open
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak RSS is then reported as None
+    resource = None
+
+# Environment variables that switch on instrumentation of the generator
+# functions, so the scripts can be measured without editing them
+METRICS_ENV = "APEX_SKUS_METRICS"
+PROFILE_ENV = "APEX_SKUS_PROFILE"
+
+PHASES = ("exclusions", "enumeration", "formatting", "writing")
+
+
+def peak_rss_bytes():
+    """
+    Peak resident set size of this process so far, or None where unknown.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def cprofile_hook(directory="."):
+    """
+    Profiler hook running cProfile around each series' enumeration loop and
+    saving the stats to <directory>/<series>.prof (read with pstats).
+    """
+    import cProfile
+
+    @contextmanager
+    def hook(spec):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(os.path.join(directory, f"{spec.name}.prof"))
+
+    return hook
+
+
+def sampling_hook(callback, interval=0.001):
+    """
+    Profiler hook that samples the generating thread's stack every `interval`
+    seconds during each series' enumeration loop and calls callback(spec,
+    frame) from a background thread with the frame being executed.
+    """
+    @contextmanager
+    def hook(spec):
+        thread_id = threading.get_ident()
+        stop = threading.Event()
+
+        def sample():
+            while not stop.wait(interval):
+                frame = sys._current_frames().get(thread_id)
+                if frame is not None:
+                    callback(spec, frame)
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            sampler.join()
+
+    return hook
+
+
+def load_hook(name):
+    """
+    Resolves a profiler hook by name: "cprofile" for cprofile_hook(), or
+    "module:attribute" naming a hook, i.e. a callable taking a SeriesSpec and
+    returning a context manager.
+    """
+    if name == "cprofile":
+        return cprofile_hook()
+    module_name, _, attribute = name.partition(":")
+    if not attribute:
+        raise ValueError(f"Unknown profiler hook '{name}'; expected cprofile or module:attribute")
+    return getattr(import_module(module_name), attribute)
+
+
+def write_staged_csv(spec, path, chunk_size=DEFAULT_CHUNK_SIZE, profile=None):
+    """
+    Writes one series to path (atomically) exactly like write_series_csv,
+    timing each phase: compiling the availability matrix the grid is built
+    from ("exclusions"; near zero once compile_availability has cached it),
+    enumerating row indices, formatting rows and writing them. profile, if
+    given, is a context manager wrapping the chunk loop. Returns {"rows",
+    "bytes", "phases": {phase: seconds}}.
+    """
+    phases = dict.fromkeys(PHASES, 0.0)
+    started = time.perf_counter()
+    compile_availability(spec)
+    phases["exclusions"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    grid = SeriesGrid(spec)
+    phases["enumeration"] = time.perf_counter() - started
+
+    with atomic_open(path, 'w', newline='') as csvfile, profile or _no_profile():
+        csv_writer = csv.writer(csvfile)
+        csv_writer.writerow(CSV_HEADER)
+        for start in range(0, grid.row_count, chunk_size):
+            started = time.perf_counter()
+            indices = grid.indices(start, start + chunk_size)
+            phases["enumeration"] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            rows = format_rows(spec, *indices)
+            phases["formatting"] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            csv_writer.writerows(rows)
+            phases["writing"] += time.perf_counter() - started
+    return {"rows": grid.row_count, "bytes": os.path.getsize(path), "phases": phases}
+
+
+class RunMetrics:
+    """
+    Instrumented generation: writes series CSVs exactly like write_series_csv
+    while recording, per series, the time spent in each phase (exclusion
+    building, enumeration, formatting, writing), rows per second, bytes
+    written, peak RSS, and how many (size, ratio, option) combinations were
+    considered and how many each exclusion rule removed.
+
+    profile_hook, if given, is called with each SeriesSpec and the context
+    manager it returns wraps that series' enumeration loop; see
+    cprofile_hook and sampling_hook.
+    """
+
+    def __init__(self, profile_hook=None):
+        self.profile_hook = profile_hook
+        self.series = []
+        self.started = time.time()
+
+    def write_series_csv(self, spec, file_name=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Generates one series into its CSV (spec.csv_file_name unless file_name
+        is given), records its metrics and returns the row count.
+        """
+        file_name = spec.csv_file_name if file_name is None else file_name
+        profile = self.profile_hook(spec) if self.profile_hook is not None else None
+        series_started = time.perf_counter()
+        written = write_staged_csv(spec, file_name, chunk_size, profile)
+        seconds = time.perf_counter() - series_started
+
+        stats = series_stats(spec)
+        options = stats["options_per_pair"]
+        self.series.append({
+            "series": spec.name,
+            "file": file_name,
+            "rows": written["rows"],
+            "bytes": written["bytes"],
+            "seconds": seconds,
+            "rows_per_second": written["rows"] / seconds if seconds else 0.0,
+            "phases": written["phases"],
+            "considered": stats["grid_pairs"] * options,
+            "excluded": stats["excluded_rows"],
+            "rules": [{"rule": rule["rule"], "excluded": rule["rows"], "only_this_rule": rule["unique_rows"]}
+                      for rule in stats["exclusions"]],
+            "peak_rss_bytes": peak_rss_bytes(),
+        })
+        return written["rows"]
+
+    def to_dict(self):
+        """
+        The run as one JSON-serializable metrics record.
+        """
+        return {
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(self.started)),
+            "rows": sum(series["rows"] for series in self.series),
+            "bytes": sum(series["bytes"] for series in self.series),
+            "seconds": sum(series["seconds"] for series in self.series),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "series": self.series,
+        }
+
+    def save(self, path):
+        """
+        Writes the metrics record to path as JSON ("-" prints it to standard error).
+        """
+        if path == "-":
+            print(json.dumps(self.to_dict(), indent=2), file=sys.stderr)
+            return
+        with open(path, "w") as metrics_file:
+            json.dump(self.to_dict(), metrics_file, indent=2)
+
+
+@contextmanager
+def _no_profile():
+    yield
+
+
+def metrics_from_environment():
+    """
+    (RunMetrics, output path) when APEX_SKUS_METRICS names an output file
+    ("-" for standard error), with the hook named by APEX_SKUS_PROFILE if set;
+    otherwise None.
+    """
+    path = os.environ.get(METRICS_ENV)
+    if not path:
+        return None
+    profile = os.environ.get(PROFILE_ENV)
+    return RunMetrics(load_hook(profile) if profile else None), path
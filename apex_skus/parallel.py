@@ -0,0 +1,103 @@
+import csv
+import io
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from apex_skus.availability import SPEC_CACHE_SIZE
+from apex_skus.registry import resolve_series
+from apex_skus.stream import CSV_HEADER, DEFAULT_CHUNK_SIZE, atomic_open
+
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def cached_grid(spec):
+    """
+    The SeriesGrid of a spec, built once per process; chunks only slice it.
+    """
+    # Imported here so users of ordered_results alone (bulk validation) do not load NumPy
+    from apex_skus.engine import SeriesGrid
+
+    return SeriesGrid(spec)
+
+
+def format_chunk(spec, start, stop):
+    """
+    Worker task: renders rows [start, stop) of a series as CSV text.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(cached_grid(spec).rows(start, stop))
+    return buffer.getvalue()
+
+
+def header_text():
+    """
+    The CSV header row as text, line ending included.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(CSV_HEADER)
+    return buffer.getvalue()
+
+
+def ordered_results(pool, function, tasks, window):
+    """
+    Yields function(*task) for every task in order, computed on pool (a
+    concurrent.futures executor) with at most `window` tasks in flight, so
+    results can be consumed while later tasks run and memory stays bounded.
+    """
+    in_flight = deque()
+    for task in tasks:
+        in_flight.append(pool.submit(function, *task))
+        if len(in_flight) >= window:
+            yield in_flight.popleft().result()
+    while in_flight:
+        yield in_flight.popleft().result()
+
+
+def _chunk_tasks(specs, chunk_size):
+    for spec in specs:
+        for start in range(0, cached_grid(spec).row_count, chunk_size):
+            yield spec, start, start + chunk_size
+
+
+def generate_series(series=None, output_dir=".", workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generates the CSV of each requested series (every series by default) into
+    output_dir and returns {series name: (file path, row count, seconds)}.
+
+    Every series is split into chunk_size-row slices which a process pool of
+    `workers` processes (default: os.cpu_count()) renders to CSV text. The
+    parent writes finished slices in catalog order while later ones are still
+    being generated, keeping a bounded number of slices in flight. Each file is
+    written to a temporary name and renamed into place when complete. Files are
+    byte-for-byte identical to a serial run. workers=1 renders in-process.
+    """
+    specs = resolve_series(series)
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(output_dir, exist_ok=True)
+    header = header_text()
+    results = {}
+
+    if workers == 1:
+        rendered = (format_chunk(*task) for task in _chunk_tasks(specs, chunk_size))
+        _write_files(specs, output_dir, header, chunk_size, rendered, results)
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        rendered = ordered_results(pool, format_chunk, _chunk_tasks(specs, chunk_size), workers * 4)
+        _write_files(specs, output_dir, header, chunk_size, rendered, results)
+    return results
+
+
+def _write_files(specs, output_dir, header, chunk_size, rendered, results):
+    rendered = iter(rendered)
+    for spec in specs:
+        started = time.perf_counter()
+        row_count = cached_grid(spec).row_count
+        path = os.path.join(output_dir, spec.csv_file_name)
+        with atomic_open(path) as csvfile:
+            csvfile.write(header)
+            for _ in range(0, row_count, chunk_size):
+                csvfile.write(next(rendered))
+        results[spec.name] = (path, row_count, time.perf_counter() - started)
@@ -0,0 +1,97 @@
+from collections import namedtuple
+
+from apex_skus.availability import compile_availability
+from apex_skus.registry import resolve_series
+
+# Structural fields of an ordering code; shaft is None for AD/ADR codes
+SkuParts = namedtuple("SkuParts", ["series", "size", "ratio", "shaft", "backlash"])
+
+
+class InvalidSkuError(ValueError):
+    """
+    Raised when a string is not a valid SKU of the loaded series. The offending
+    code and the reason are available as .sku and .reason.
+    """
+
+    def __init__(self, sku, reason):
+        super().__init__(f"'{sku}': {reason}")
+        self.sku = sku
+        self.reason = reason
+
+
+class SkuParser:
+    """
+    Structural parser for ordering codes (SIZE-RATIO-[SHAFT-]BACKLASH) backed by
+    the compiled availability matrices; needs neither NumPy nor the catalog.
+    """
+
+    def __init__(self, specs=None):
+        """
+        specs is a list of series names or SeriesSpecs; defaults to every series.
+        """
+        self.specs = resolve_series(specs)
+        self.matrices = {}
+        self._size_series = {}
+        for spec in self.specs:
+            self.matrices[spec.name] = compile_availability(spec)
+            for size in spec.sizes:
+                if size in self._size_series:
+                    raise ValueError(f"Gearbox size '{size}' is defined by more than one series")
+                self._size_series[size] = spec
+
+    def series_of(self, size):
+        """
+        The SeriesSpec a gearbox size belongs to, or None.
+        """
+        return self._size_series.get(size)
+
+    def parse(self, sku):
+        """
+        Splits an ordering code into SkuParts and checks each field against its
+        series tables. Availability of the (size, ratio) pair is not checked here.
+        """
+        fields = sku.strip().split("-")
+        if len(fields) not in (3, 4):
+            raise InvalidSkuError(sku, "expected SIZE-RATIO-[SHAFT-]BACKLASH")
+        size = fields[0]
+        spec = self._size_series.get(size)
+        if spec is None:
+            raise InvalidSkuError(sku, f"unknown gearbox size '{size}'")
+        ratio_field = fields[1]
+        if (len(ratio_field) != 3 or not ratio_field.isdigit()
+                or not self.matrices[spec.name].has_ratio(int(ratio_field))):
+            raise InvalidSkuError(sku, f"ratio '{ratio_field}' is not offered in the {spec.label}")
+        if spec.has_shaft != (len(fields) == 4):
+            expected = "a shaft option" if spec.has_shaft else "no shaft option"
+            raise InvalidSkuError(sku, f"{spec.label} codes have {expected}")
+        shaft = fields[2] if spec.has_shaft else None
+        if shaft is not None and shaft not in spec.shaft_options:
+            raise InvalidSkuError(sku, f"shaft option '{shaft}' is not offered in the {spec.label}")
+        backlash = fields[-1]
+        if backlash not in spec.backlash_options:
+            raise InvalidSkuError(sku, f"backlash '{backlash}' is not offered in the {spec.label}")
+        return SkuParts(spec.name, size, int(ratio_field), shaft, backlash)
+
+    def check(self, sku):
+        """
+        Parses an ordering code and checks that its (size, ratio) pair is
+        available. Returns SkuParts; raises InvalidSkuError naming the
+        exclusion rule otherwise.
+        """
+        parts = self.parse(sku)
+        matrix = self.matrices[parts.series]
+        if not matrix.is_available(parts.size, parts.ratio):
+            rules = ", ".join(f"'{rule.description}'" for rule in matrix.excluded_by(parts.size, parts.ratio))
+            raise InvalidSkuError(sku, f"ratio {parts.ratio} is not available for {parts.size} "
+                                  f"(excluded by {rules})")
+        return parts
+
+    def explain(self, sku):
+        """
+        Returns None for a valid SKU, otherwise the reason it is invalid.
+        """
+        try:
+            self.check(sku)
+        except InvalidSkuError as error:
+            return error.reason
+        return None
@@ -0,0 +1,135 @@
+from bisect import bisect_left
+
+from apex_skus.parsing import InvalidSkuError, SkuParser
+
+
+def _prefix_range(values, partial):
+    """
+    The entries of a sorted tuple of strings that start with partial.
+    """
+    low = bisect_left(values, partial)
+    high = bisect_left(values, partial + "\uffff", low)
+    return values[low:high]
+
+
+class SkuPrefixIndex:
+    """
+    Prefix index over the ordering-code grammar SIZE-RATIO-[SHAFT-]BACKLASH.
+
+    Each segment has a small sorted table: all gearbox sizes, the available
+    ratio labels of each size (from the compiled availability matrix), and the
+    shaft and backlash options of each series. A prefix is resolved segment by
+    segment with dict lookups and one bisect on the table of the segment being
+    typed, so lookups never scan the catalog and the index holds a few
+    thousand strings at most.
+    """
+
+    def __init__(self, specs=None):
+        """
+        specs is a list of series names or SeriesSpecs; defaults to every series.
+        """
+        self.parser = SkuParser(specs)
+        self._sizes = tuple(sorted(size for spec in self.parser.specs for size in spec.sizes))
+        self._ratio_labels = {}
+        self._shafts = {}
+        self._backlashes = {}
+        for spec in self.parser.specs:
+            matrix = self.parser.matrices[spec.name]
+            for size in spec.sizes:
+                self._ratio_labels[size] = tuple(sorted(f"{ratio:03d}" for ratio in matrix.ratios_for(size)))
+            self._shafts[spec.name] = tuple(sorted(spec.shaft_options)) if spec.has_shaft else None
+            self._backlashes[spec.name] = tuple(sorted(spec.backlash_options))
+
+    def _segment_values(self, segments):
+        """
+        Sorted values allowed for the segment after the completed segments, or
+        () when the code is already complete. Raises InvalidSkuError when a
+        completed segment is invalid.
+        """
+        if not segments:
+            return self._sizes
+        size = segments[0]
+        spec = self.parser.series_of(size)
+        if spec is None:
+            raise InvalidSkuError(size, f"unknown gearbox size '{size}'")
+        grammar = [self._ratio_labels[size]]
+        if spec.has_shaft:
+            grammar.append(self._shafts[spec.name])
+        grammar.append(self._backlashes[spec.name])
+        code = "-".join(segments)
+        for position, value in enumerate(segments[1:]):
+            if position >= len(grammar):
+                raise InvalidSkuError(code, f"{spec.label} codes have {len(grammar) + 1} segments")
+            if value not in grammar[position]:
+                raise InvalidSkuError(code, self._segment_reason(spec, size, position, value))
+        remaining = len(segments) - 1
+        return grammar[remaining] if remaining < len(grammar) else ()
+
+    def _segment_reason(self, spec, size, position, value):
+        if position == 0:
+            matrix = self.parser.matrices[spec.name]
+            if value.isdigit() and len(value) == 3 and matrix.has_ratio(int(value)):
+                rules = ", ".join(f"'{rule.description}'" for rule in matrix.excluded_by(size, int(value)))
+                return f"ratio {int(value)} is not available for {size} (excluded by {rules})"
+            return f"ratio '{value}' is not offered in the {spec.label}"
+        if position == 1 and spec.has_shaft:
+            return f"shaft option '{value}' is not offered in the {spec.label}"
+        return f"backlash '{value}' is not offered in the {spec.label}"
+
+    def complete(self, prefix, limit=None):
+        """
+        Valid completions of prefix up to the end of the segment being typed,
+        in sorted order, e.g. "AFXR075-0" -> ["AFXR075-003", "AFXR075-004", ...].
+        A complete valid code completes to itself; an invalid prefix to [].
+        """
+        segments = prefix.split("-")
+        try:
+            values = self._segment_values(segments[:-1])
+        except InvalidSkuError:
+            return []
+        head = prefix[:len(prefix) - len(segments[-1])]
+        matches = _prefix_range(values, segments[-1])
+        if limit is not None:
+            matches = matches[:limit]
+        return [head + value for value in matches]
+
+    def next_chars(self, prefix):
+        """
+        Sorted set of characters that can follow prefix in some valid code,
+        including "-" when the current segment is complete and more follow.
+        """
+        segments = prefix.split("-")
+        try:
+            values = self._segment_values(segments[:-1])
+            partial = segments[-1]
+            chars = {value[len(partial)] for value in _prefix_range(values, partial) if len(value) > len(partial)}
+            if partial in values and self._segment_values(segments):
+                chars.add("-")
+        except InvalidSkuError:
+            return []
+        return sorted(chars)
+
+    def explain_prefix(self, prefix):
+        """
+        None if prefix can still become a valid code, otherwise the reason it cannot.
+        """
+        segments = prefix.split("-")
+        try:
+            values = self._segment_values(segments[:-1])
+        except InvalidSkuError as error:
+            return f"'{prefix}': {error.reason}"
+        if not _prefix_range(values, segments[-1]):
+            try:
+                # A fully typed but invalid segment gets the specific reason
+                self._segment_values(segments)
+            except InvalidSkuError as error:
+                return f"'{prefix}': {error.reason}"
+            return f"'{prefix}': no valid code starts with this prefix"
+        return None
+
+    def validate(self, code):
+        """
+        (True, None) for a valid complete code, otherwise (False, reason).
+        """
+        reason = self.parser.explain(code)
+        return reason is None, reason
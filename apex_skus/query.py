@@ -0,0 +1,124 @@
+import numpy as np
+
+from apex_skus.engine import SeriesGrid
+from apex_skus.registry import resolve_series
+from apex_skus.stream import DEFAULT_CHUNK_SIZE
+
+
+def _as_set(value):
+    """
+    Normalizes a predicate argument: None stays None, a single value becomes a
+    one-element set.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (str, int)):
+        return {value}
+    return set(value)
+
+
+class SkuQuery:
+    """
+    Predicates over the catalog, pushed down into the enumeration.
+
+    Each predicate narrows one dimension before any row is expanded: series and
+    sizes select rows of the availability mask, ratio_range and stages select
+    its columns, shafts and backlash restrict the option fan-out. The work done
+    per series is proportional to the number of matching rows, plus one pass
+    over the (size, ratio) tables.
+
+    series, sizes, shafts and backlash take a single value or an iterable;
+    ratio_range is an inclusive (low, high) tuple where either end may be None;
+    stages is 1, 2 or both. "N/A" in shafts matches AD/ADR, which have no shaft
+    segment; any other shaft filter leaves them out.
+    """
+
+    def __init__(self, series=None, sizes=None, ratio_range=None, stages=None,
+                 shafts=None, backlash=None):
+        self.series = None if series is None else [name.upper() for name in _as_set(series)]
+        self.sizes = _as_set(sizes)
+        self.ratio_range = ratio_range
+        self.stages = _as_set(stages)
+        self.shafts = _as_set(shafts)
+        self.backlash = _as_set(backlash)
+
+    def _ratio_select(self, spec):
+        low, high = self.ratio_range if self.ratio_range is not None else (None, None)
+        stage_ratios = None
+        if self.stages is not None:
+            stage_ratios = set()
+            if 1 in self.stages:
+                stage_ratios.update(spec.ratios_1_stage)
+            if 2 in self.stages:
+                stage_ratios.update(spec.ratios_2_stage)
+        return np.array([(low is None or ratio >= low) and (high is None or ratio <= high)
+                         and (stage_ratios is None or ratio in stage_ratios)
+                         for ratio in spec.ratios], dtype=bool)
+
+    def grid(self, spec):
+        """
+        Returns the SeriesGrid of the rows of spec that match, or None when a
+        predicate rules the whole series out.
+        """
+        if self.series is not None and spec.name not in self.series:
+            return None
+        shaft_select = None
+        if self.shafts is not None:
+            if not spec.has_shaft:
+                if "N/A" not in self.shafts:
+                    return None
+            else:
+                shaft_select = [k for k, shaft in enumerate(spec.shaft_options) if shaft in self.shafts]
+        backlash_select = None
+        if self.backlash is not None:
+            backlash_select = [k for k, backlash in enumerate(spec.backlash_options) if backlash in self.backlash]
+        size_select = None
+        if self.sizes is not None:
+            size_select = np.array([size in self.sizes for size in spec.sizes], dtype=bool)
+        return SeriesGrid(spec, size_select, self._ratio_select(spec), shaft_select, backlash_select)
+
+    def grids(self, specs=None):
+        """
+        Yields the non-empty SeriesGrids matching the query, in registry order.
+        """
+        for spec in resolve_series(specs):
+            grid = self.grid(spec)
+            if grid is not None and grid.row_count:
+                yield grid
+
+    def count(self, specs=None):
+        """
+        Number of matching SKUs, computed without building any row.
+        """
+        return sum(grid.row_count for grid in self.grids(specs))
+
+    def iter_rows(self, specs=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Yields the matching CSV rows, built chunk_size rows at a time.
+        """
+        for grid in self.grids(specs):
+            for chunk in grid.iter_chunks(chunk_size):
+                yield from chunk
+
+    def iter_skus(self, specs=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Yields the matching SKU strings.
+        """
+        for row in self.iter_rows(specs, chunk_size):
+            yield row[5]
+
+
+def query_skus(series=None, sizes=None, ratio_range=None, stages=None,
+               shafts=None, backlash=None):
+    """
+    Iterates over the CSV rows matching the given predicates; see SkuQuery.
+    """
+    return SkuQuery(series, sizes, ratio_range, stages, shafts, backlash).iter_rows()
+
+
+def count_skus(series=None, sizes=None, ratio_range=None, stages=None,
+               shafts=None, backlash=None):
+    """
+    Counts the SKUs matching the given predicates; see SkuQuery.
+    """
+    return SkuQuery(series, sizes, ratio_range, stages, shafts, backlash).count()
@@ -0,0 +1,67 @@
+import json
+import os
+import runpy
+from importlib import import_module
+
+from apex_skus.spec import SeriesSpec
+
+# Every series, in the order the generator scripts write them. Each one is
+# defined by the SPEC of apex_skus.series.<name in lower case>, imported the
+# first time the series is requested.
+SERIES_NAMES = ("AB", "ABR", "AF", "AFR", "AFX", "AFXR", "AD", "ADR", "ADS")
+
+
+def series_module_name(name):
+    """
+    Dotted name of the module defining a series, e.g. "apex_skus.series.abr".
+    """
+    return f"apex_skus.series.{name.lower()}"
+
+
+def get_series(name):
+    """
+    Returns the SeriesSpec for a series name such as "ABR" (case-insensitive).
+    """
+    if name.upper() not in SERIES_NAMES:
+        raise KeyError(f"Unknown series '{name}'; expected one of {', '.join(SERIES_NAMES)}")
+    return import_module(series_module_name(name)).SPEC
+
+
+def resolve_series(names=None):
+    """
+    Returns the SeriesSpecs for the given names, or for every series if names is
+    None. SeriesSpec objects in names are passed through unchanged.
+    """
+    if names is None:
+        names = SERIES_NAMES
+    return [name if isinstance(name, SeriesSpec) else get_series(name) for name in names]
+
+
+def load_specs(source):
+    """
+    Loads a version of the series definitions as {series name: SeriesSpec}.
+
+    source is "current" (this registry), a directory of series modules such as
+    an older checkout of apex_skus/series, a single .py file, or a .json file
+    holding a list of SeriesSpec.to_dict() records. Python sources contribute
+    every SeriesSpec defined at module level.
+    """
+    if source == "current":
+        return {spec.name: spec for spec in resolve_series()}
+    specs = {}
+    paths = []
+    if os.path.isdir(source):
+        paths = [os.path.join(source, file_name) for file_name in sorted(os.listdir(source))
+                 if file_name.endswith(".py") and file_name != "__init__.py"]
+    elif source.endswith(".json"):
+        with open(source) as spec_file:
+            specs = {spec.name: spec for spec in map(SeriesSpec.from_dict, json.load(spec_file))}
+    else:
+        paths = [source]
+    for path in paths:
+        for value in runpy.run_path(path).values():
+            if isinstance(value, SeriesSpec):
+                specs[value.name] = value
+    # Keep registry order for known series, then anything new by name
+    order = {name: i for i, name in enumerate(SERIES_NAMES)}
+    return dict(sorted(specs.items(), key=lambda item: (order.get(item[0], len(order)), item[0])))
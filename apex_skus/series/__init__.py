@@ -0,0 +1,3 @@
+"""
+One module per gearbox series, each defining a SeriesSpec named SPEC.
+"""
@@ -0,0 +1,23 @@
+from apex_skus.spec import ExclusionRule, SeriesSpec
+
+# --- Define parameters for AB Series ---
+ab_sizes = [
+    "AB042", "AB060", "AB060A", "AB090", "AB090A",
+    "AB115", "AB115A", "AB142", "AB142A", "AB180", "AB220"
+]
+ab_ratios_1_stage = [3, 4, 5, 6, 7, 8, 9, 10]
+ab_ratios_2_stage = [
+    12, 15, 16, 20, 25, 28, 30, 32, 35, 40, 45, 50, 60, 70, 80, 90, 100
+]
+
+# Explicitly unavailable AB Series combinations based on Page 4 of the PDF
+SPEC = SeriesSpec(
+    name="AB",
+    sizes=ab_sizes,
+    ratios_1_stage=ab_ratios_1_stage,
+    ratios_2_stage=ab_ratios_2_stage,
+    exclusions=[
+        ExclusionRule("1-stage ratios on A models",
+                      ["AB060A", "AB090A", "AB115A", "AB142A"], ab_ratios_1_stage),
+    ],
+)
@@ -0,0 +1,28 @@
+from apex_skus.spec import ExclusionRule, SeriesSpec
+
+# --- Define parameters for ABR Series ---
+abr_sizes = [
+    "ABR042", "ABR060", "ABR060A", "ABR090", "ABR090A",
+    "ABR115", "ABR115A", "ABR142", "ABR142A", "ABR180", "ABR220"
+]
+abr_ratios_1_stage = [3, 4, 5, 6, 7, 8, 9, 10, 12, 14, 16, 20]
+abr_ratios_2_stage = [
+    12, 15, 16, 20, 25, 28, 30, 32, 35, 40, 45, 48, 50, 60, 64, 70, 80,
+    90, 100, 120, 140, 160, 180, 200
+]
+
+# Explicitly unavailable ABR Series combinations based on Page 8 of the PDF
+SPEC = SeriesSpec(
+    name="ABR",
+    sizes=abr_sizes,
+    ratios_1_stage=abr_ratios_1_stage,
+    ratios_2_stage=abr_ratios_2_stage,
+    exclusions=[
+        ExclusionRule("1-stage ratios on A models",
+                      ["ABR060A", "ABR090A", "ABR115A", "ABR142A"], abr_ratios_1_stage),
+        ExclusionRule("2-stage ratios 12-20",
+                      abr_sizes, [12, 15, 16, 20]),
+        ExclusionRule("2-stage ratios 120-200 below ABR180",
+                      abr_sizes[:9], [120, 140, 160, 180, 200]),
+    ],
+)
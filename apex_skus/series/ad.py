@@ -0,0 +1,20 @@
+from apex_skus.spec import SeriesSpec
+
+# --- Define parameters for AD Series ---
+ad_sizes = [
+    "AD047", "AD064", "AD090", "AD110", "AD140", "AD200", "AD255"
+]
+ad_ratios_1_stage = [4, 5, 7, 10]
+ad_ratios_2_stage = [
+    16, 20, 21, 25, 31, 35, 40, 50, 61, 70, 91, 100
+]
+
+# AD series does not have a shaft option in the ordering code.
+# No explicit dashes in the AD series table (Page 4 of the PDF), so there are no exclusions.
+SPEC = SeriesSpec(
+    name="AD",
+    sizes=ad_sizes,
+    ratios_1_stage=ad_ratios_1_stage,
+    ratios_2_stage=ad_ratios_2_stage,
+    shaft_options=None,
+)
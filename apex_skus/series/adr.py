@@ -0,0 +1,26 @@
+from apex_skus.spec import ExclusionRule, SeriesSpec
+
+# --- Define parameters for ADR Series ---
+adr_sizes = [
+    "ADR047", "ADR064", "ADR090", "ADR110", "ADR140", "ADR200", "ADR255"
+]
+adr_ratios_1_stage = [4, 5, 7, 10, 14, 20]
+adr_ratios_2_stage = [
+    20, 25, 35, 40, 50, 70, 100, 140, 200
+]
+
+# ADR series does not have a shaft option in the ordering code.
+# Explicitly unavailable ADR Series combinations based on Page 8 of the PDF
+SPEC = SeriesSpec(
+    name="ADR",
+    sizes=adr_sizes,
+    ratios_1_stage=adr_ratios_1_stage,
+    ratios_2_stage=adr_ratios_2_stage,
+    shaft_options=None,
+    exclusions=[
+        ExclusionRule("1-stage ratio 14 from ADR090 up",
+                      ["ADR090", "ADR110", "ADR140", "ADR200", "ADR255"], [14]),
+        ExclusionRule("2-stage ratios 140 and 200 up to ADR110",
+                      ["ADR047", "ADR064", "ADR090", "ADR110"], [140, 200]),
+    ],
+)
@@ -0,0 +1,20 @@
+from apex_skus.spec import SeriesSpec
+
+# --- Define parameters for ADS Series ---
+ads_sizes = [
+    "ADS047", "ADS064", "ADS090", "ADS110", "ADS140", "ADS200", "ADS255"
+]
+ads_ratios_1_stage = [4, 5, 7, 10]
+ads_ratios_2_stage = [
+    16, 21, 31, 61, 91
+]
+
+# ADS has specific shaft options.
+# No explicit dashes in the ADS series table (Page 11 of the PDF), so there are no exclusions.
+SPEC = SeriesSpec(
+    name="ADS",
+    sizes=ads_sizes,
+    ratios_1_stage=ads_ratios_1_stage,
+    ratios_2_stage=ads_ratios_2_stage,
+    shaft_options=["S1", "S2"],
+)
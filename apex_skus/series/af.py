@@ -0,0 +1,24 @@
+from apex_skus.spec import ExclusionRule, SeriesSpec
+
+# --- Define parameters for AF Series ---
+af_sizes = [
+    "AF042", "AF060", "AF060A", "AF075", "AF075A",
+    "AF100", "AF100A", "AF140", "AF140A", "AF180", "AF220"
+]
+af_ratios_1_stage = [3, 4, 5, 6, 7, 8, 9, 10]
+af_ratios_2_stage = [
+    12, 15, 16, 20, 25, 28, 30, 32, 35, 40, 45, 50, 60, 70, 80, 90, 100
+]
+
+# Explicitly unavailable AF Series combinations based on Page 4 of the PDF
+SPEC = SeriesSpec(
+    name="AF",
+    sizes=af_sizes,
+    ratios_1_stage=af_ratios_1_stage,
+    ratios_2_stage=af_ratios_2_stage,
+    exclusions=[
+        ExclusionRule("Ratio 7 on AF075A", ["AF075A"], [7]),
+        ExclusionRule("1-stage ratios on A models, AF180 and AF220",
+                      ["AF060A", "AF100A", "AF140A", "AF180", "AF220"], af_ratios_1_stage),
+    ],
+)
@@ -0,0 +1,30 @@
+from apex_skus.spec import ExclusionRule, SeriesSpec
+
+# --- Define parameters for AFR Series ---
+afr_sizes = [
+    "AFR042", "AFR060", "AFR060A", "AFR075", "AFR075A",
+    "AFR100", "AFR100A", "AFR140", "AFR140A", "AFR180", "AFR220"
+]
+afr_ratios_1_stage = [3, 4, 5, 6, 7, 8, 9, 10, 12, 14, 16, 20]
+afr_ratios_2_stage = [
+    12, 15, 16, 20, 25, 28, 30, 32, 35, 40, 45, 48, 50, 60, 64, 70, 80,
+    90, 100, 120, 140, 160, 180, 200
+]
+
+# Explicitly unavailable AFR Series combinations based on Page 8 of the PDF
+SPEC = SeriesSpec(
+    name="AFR",
+    sizes=afr_sizes,
+    ratios_1_stage=afr_ratios_1_stage,
+    ratios_2_stage=afr_ratios_2_stage,
+    exclusions=[
+        ExclusionRule("1-stage ratios on A models",
+                      ["AFR060A", "AFR075A", "AFR100A", "AFR140A"], afr_ratios_1_stage),
+        ExclusionRule("Ratios 6 and 12 on AFR180 and AFR220",
+                      ["AFR180", "AFR220"], [6, 12]),
+        ExclusionRule("2-stage ratios 12-20 below AFR180",
+                      afr_sizes[:9], [12, 15, 16, 20]),
+        ExclusionRule("2-stage ratios 120-200 below AFR180",
+                      afr_sizes[:9], [120, 140, 160, 180, 200]),
+    ],
+)
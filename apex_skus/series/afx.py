@@ -0,0 +1,24 @@
+from apex_skus.spec import ExclusionRule, SeriesSpec
+
+# --- Define parameters for AFX Series ---
+afx_sizes = [
+    "AFX042", "AFX060", "AFX060A", "AFX075", "AFX075A",
+    "AFX100", "AFX100A", "AFX140", "AFX140A", "AFX180"
+]
+afx_ratios_1_stage = [3, 4, 5, 6, 7, 8, 9, 10]
+afx_ratios_2_stage = [
+    12, 15, 16, 20, 25, 28, 30, 32, 35, 40, 45, 50, 60, 70, 80, 90, 100
+]
+
+# Explicitly unavailable AFX Series combinations based on Page 4 of the PDF
+SPEC = SeriesSpec(
+    name="AFX",
+    sizes=afx_sizes,
+    ratios_1_stage=afx_ratios_1_stage,
+    ratios_2_stage=afx_ratios_2_stage,
+    exclusions=[
+        ExclusionRule("1-stage ratios on A models and AFX180",
+                      ["AFX060A", "AFX075A", "AFX100A", "AFX140A", "AFX180"], afx_ratios_1_stage),
+        ExclusionRule("Ratio 6 on AFX100 and AFX140", ["AFX100", "AFX140"], [6]),
+    ],
+)
@@ -0,0 +1,31 @@
+from apex_skus.spec import ExclusionRule, SeriesSpec
+
+# --- Define parameters for AFXR Series ---
+afxr_sizes = [
+    "AFXR042", "AFXR060", "AFXR060A", "AFXR075", "AFXR075A",
+    "AFXR100", "AFXR100A", "AFXR140", "AFXR140A", "AFXR180"
+]
+afxr_ratios_1_stage = [3, 4, 5, 6, 7, 8, 9, 10, 12, 14, 16, 20]
+afxr_ratios_2_stage = [
+    12, 15, 16, 20, 25, 28, 30, 32, 35, 40, 45, 48, 50, 60, 64, 70, 80,
+    90, 100, 120, 140, 160, 180, 200
+]
+
+# Explicitly unavailable AFXR Series combinations based on Page 8 of the PDF
+SPEC = SeriesSpec(
+    name="AFXR",
+    sizes=afxr_sizes,
+    ratios_1_stage=afxr_ratios_1_stage,
+    ratios_2_stage=afxr_ratios_2_stage,
+    exclusions=[
+        ExclusionRule("1-stage ratios on A models",
+                      ["AFXR060A", "AFXR075A", "AFXR100A", "AFXR140A"], afxr_ratios_1_stage),
+        ExclusionRule("Ratio 8 on AFXR180", ["AFXR180"], [8]),
+        ExclusionRule("Ratio 12 on AFXR060, AFXR075, AFXR100 and AFXR140",
+                      ["AFXR060", "AFXR075", "AFXR100", "AFXR140"], [12]),
+        ExclusionRule("2-stage ratios 12-20 below AFXR180",
+                      afxr_sizes[:9], [12, 15, 16, 20]),
+        ExclusionRule("2-stage ratios 120-200 below AFXR180",
+                      afxr_sizes[:9], [120, 140, 160, 180, 200]),
+    ],
+)
@@ -0,0 +1,371 @@
+import asyncio
+import json
+from itertools import islice
+from urllib.parse import parse_qs, urlsplit
+
+from apex_skus.parsing import InvalidSkuError, SkuParser
+from apex_skus.prefix import SkuPrefixIndex
+from apex_skus.query import SkuQuery
+from apex_skus.registry import resolve_series
+from apex_skus.stats import catalog_stats
+
+DEFAULT_PORT = 8765
+DEFAULT_LIST_LIMIT = 1000
+
+# Largest page /query returns; pages are built on the event loop, so an
+# unbounded one would stall every other connection
+MAX_LIST_LIMIT = 10000
+
+# Largest request body accepted, to bound memory per connection
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+class RequestError(Exception):
+    """
+    A client error, answered with HTTP 400 and the message.
+    """
+
+
+def _values(params, name):
+    """
+    All values of a string parameter; repeated (?size=A&size=B) and
+    comma-separated (?size=A,B) forms are both accepted, as are a JSON string
+    or list of strings. Returns None if it is absent.
+    """
+    raw = params.get(name)
+    if raw is None:
+        return None
+    if not isinstance(raw, list):
+        raw = [raw]
+    values = []
+    for item in raw:
+        if not isinstance(item, str):
+            raise RequestError(f"'{name}' must be a string or a list of strings")
+        values.extend(item.split(","))
+    return values
+
+
+def _int_values(params, name):
+    """
+    All values of an integer parameter, given as integers or as strings in
+    the forms _values accepts. Returns None if it is absent.
+    """
+    raw = params.get(name)
+    if raw is None:
+        return None
+    if not isinstance(raw, list):
+        raw = [raw]
+    values = []
+    for item in raw:
+        if isinstance(item, int) and not isinstance(item, bool):
+            values.append(item)
+            continue
+        if not isinstance(item, str):
+            raise RequestError(f"'{name}' must be an integer or a list of integers")
+        for text in item.split(","):
+            try:
+                values.append(int(text))
+            except ValueError:
+                raise RequestError(f"'{name}' must be an integer") from None
+    return values
+
+
+def _int_param(params, name, default=None):
+    """
+    First value of a non-negative integer parameter, or default if it is absent.
+    """
+    values = _int_values(params, name)
+    if not values:
+        return default
+    if values[0] < 0:
+        raise RequestError(f"'{name}' must not be negative")
+    return values[0]
+
+
+class CatalogService:
+    """
+    The in-memory catalog answering service requests: series definitions,
+    compiled availability, parser and prefix index are loaded once.
+
+    Every operation takes a dict of parameters and returns a JSON-serializable
+    dict, so the same code serves GET query strings, POST bodies and batches.
+    """
+
+    def __init__(self, specs=None):
+        self.specs = resolve_series(specs)
+        self.parser = SkuParser(self.specs)
+        self.prefix_index = SkuPrefixIndex(self.specs)
+        self.stats = catalog_stats(self.specs)
+        self.operations = {
+            "validate": self.validate,
+            "count": self.count,
+            "list": self.listing,
+            "query": self.query,
+            "complete": self.complete,
+        }
+
+    def _query(self, params):
+        ratio_min = _int_param(params, "ratio_min")
+        ratio_max = _int_param(params, "ratio_max")
+        return SkuQuery(
+            series=_values(params, "series"),
+            sizes=_values(params, "size"),
+            ratio_range=None if ratio_min is None and ratio_max is None else (ratio_min, ratio_max),
+            stages=_int_values(params, "stage"),
+            shafts=_values(params, "shaft"),
+            backlash=_values(params, "backlash"),
+        )
+
+    def validate(self, params):
+        """
+        {"sku": code} or {"skus": [codes]} -> verdict(s) with series and reason.
+        """
+        skus = _values(params, "skus") or _values(params, "sku")
+        if not skus:
+            raise RequestError("validate needs 'sku' or 'skus'")
+        results = []
+        for sku in skus:
+            try:
+                parts = self.parser.check(sku)
+            except InvalidSkuError as error:
+                results.append({"sku": sku, "valid": False, "series": None, "reason": error.reason})
+            else:
+                results.append({"sku": sku, "valid": True, "series": parts.series, "reason": None})
+        return {"results": results} if "skus" in params else results[0]
+
+    def count(self, params):
+        """
+        Number of SKUs matching the query predicates; all series without any.
+        """
+        return {"count": self._query(params).count(self.specs)}
+
+    def listing(self, params):
+        """
+        Without parameters: the series and their SKU counts. With 'size': the
+        available ratios of each size. With 'series': its sizes.
+        """
+        sizes = _values(params, "size")
+        if sizes:
+            ratios = {}
+            for size in sizes:
+                spec = self.parser.series_of(size)
+                if spec is None:
+                    raise RequestError(f"unknown gearbox size '{size}'")
+                ratios[size] = self.parser.matrices[spec.name].ratios_for(size)
+            return {"ratios": ratios}
+        names = _values(params, "series")
+        if names:
+            wanted = {name.upper() for name in names}
+            return {"sizes": {spec.name: list(spec.sizes) for spec in self.specs if spec.name in wanted}}
+        return {"series": {series["series"]: series["total"] for series in self.stats["series"]}}
+
+    def query(self, params):
+        """
+        SKUs matching the query predicates, paged with 'offset' and 'limit'
+        (at most MAX_LIST_LIMIT SKUs per page).
+        """
+        query = self._query(params)
+        offset = _int_param(params, "offset", 0)
+        limit = min(_int_param(params, "limit", DEFAULT_LIST_LIMIT), MAX_LIST_LIMIT)
+        skus = list(islice(query.iter_skus(self.specs), offset, offset + limit))
+        return {"count": query.count(self.specs), "offset": offset, "skus": skus}
+
+    def complete(self, params):
+        """
+        Typeahead completions of 'prefix'.
+        """
+        prefix = (_values(params, "prefix") or [""])[0]
+        limit = _int_param(params, "limit")
+        return {"prefix": prefix, "completions": self.prefix_index.complete(prefix, limit),
+                "reason": self.prefix_index.explain_prefix(prefix)}
+
+    def batch(self, requests):
+        """
+        Runs a list of {"op": name, ...params} requests and returns their
+        results in order; a failing request yields {"error": message}.
+        """
+        if not isinstance(requests, list):
+            raise RequestError("batch needs a JSON list of requests")
+        results = []
+        for request in requests:
+            try:
+                operation = self.operations.get(request.get("op")) if isinstance(request, dict) else None
+                if operation is None:
+                    raise RequestError(f"unknown op in {request!r}")
+                results.append(operation(request))
+            except (RequestError, KeyError, ValueError) as error:
+                results.append({"error": str(error)})
+        return {"results": results}
+
+    def handle(self, method, target, body):
+        """
+        Dispatches one HTTP request; returns (status, payload).
+        """
+        url = urlsplit(target)
+        name = url.path.strip("/")
+        try:
+            if method == "GET":
+                params = parse_qs(url.query)
+            elif method == "POST":
+                params = json.loads(body) if body else {}
+            else:
+                return 405, {"error": f"method {method} not allowed"}
+            if name == "batch" and method == "POST":
+                return 200, self.batch(params)
+            if name == "health":
+                return 200, {"status": "ok"}
+            operation = self.operations.get(name)
+            if operation is None:
+                return 404, {"error": f"unknown endpoint '/{name}'"}
+            if not isinstance(params, dict):
+                raise RequestError("request body must be a JSON object")
+            return 200, operation(params)
+        except (RequestError, KeyError, ValueError) as error:
+            return 400, {"error": str(error)}
+
+
+async def _read_request(reader):
+    """
+    Reads one HTTP/1.1 request; returns (method, target, headers, body), or
+    None when the client closed the connection.
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    lines = head.decode("latin-1").split("\r\n")
+    method, target, _ = lines[0].split(" ", 2)
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            key, value = line.split(":", 1)
+            headers[key.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if length > MAX_BODY_BYTES:
+        raise RequestError("request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method, target, headers, body
+
+
+def _response(status, payload, keep_alive):
+    reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               500: "Internal Server Error"}
+    body = json.dumps(payload).encode("utf-8")
+    head = (f"HTTP/1.1 {status} {reasons.get(status, 'Error')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+def make_handler(service):
+    """
+    asyncio stream handler serving requests on one keep-alive connection
+    until the client closes it or sends "Connection: close".
+    """
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except (RequestError, ValueError) as error:
+                    writer.write(_response(400, {"error": str(error)}, keep_alive=False))
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    status, payload = service.handle(method, target, body)
+                except Exception as error:
+                    # A bug in one request must not drop the connection's other requests
+                    status, payload = 500, {"error": f"internal error: {error!r}"}
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+    return handle_connection
+
+
+async def start_server(service=None, host="127.0.0.1", port=DEFAULT_PORT, unix_path=None):
+    """
+    Starts the service on a TCP port (port 0 picks a free one) or, when
+    unix_path is given, on a Unix socket. Returns the asyncio Server.
+    """
+    handler = make_handler(service or CatalogService())
+    if unix_path is not None:
+        return await asyncio.start_unix_server(handler, path=unix_path)
+    return await asyncio.start_server(handler, host, port)
+
+
+def serve(host="127.0.0.1", port=DEFAULT_PORT, unix_path=None, specs=None):
+    """
+    Runs the service until interrupted, printing the address it listens on.
+    """
+    async def main():
+        server = await start_server(CatalogService(specs), host, port, unix_path)
+        address = unix_path or "%s:%d" % server.sockets[0].getsockname()[:2]
+        print(f"Serving the Apex Dynamics SKU catalog on {address}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+class CatalogClient:
+    """
+    Minimal asyncio client for the service, keeping one connection alive
+    across requests. Stands in for the internal tools that call the service.
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, unix_path=None):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self._reader = None
+        self._writer = None
+
+    async def connect(self):
+        if self.unix_path is not None:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.unix_path)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+    async def request(self, path, payload=None):
+        """
+        GETs path (which may carry a query string), or POSTs payload as JSON.
+        Returns (status, decoded JSON body).
+        """
+        if self._writer is None:
+            await self.connect()
+        if payload is None:
+            head = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n"
+            self._writer.write(head.encode("latin-1"))
+        else:
+            body = json.dumps(payload).encode("utf-8")
+            head = (f"POST {path} HTTP/1.1\r\nHost: localhost\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+            self._writer.write(head.encode("latin-1") + body)
+        await self._writer.drain()
+        response = await self._reader.readuntil(b"\r\n\r\n")
+        lines = response.decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ", 2)[1])
+        length = 0
+        for line in lines[1:]:
+            if line.lower().startswith("content-length:"):
+                length = int(line.split(":", 1)[1])
+        return status, json.loads(await self._reader.readexactly(length))
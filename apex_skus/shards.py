@@ -0,0 +1,191 @@
+import gzip
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+import numpy as np
+
+from apex_skus.parallel import cached_grid, format_chunk, header_text, ordered_results
+from apex_skus.registry import resolve_series
+from apex_skus.stream import CSV_HEADER, DEFAULT_CHUNK_SIZE, DEFAULT_SHARD_ROWS, atomic_open
+
+try:
+    import zstandard
+except ImportError:  # zstd output is optional
+    zstandard = None
+
+# File name suffix of each output compression
+COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+# Fixed compression settings, so the same rows always give the same bytes
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def compress_block(data, compression):
+    """
+    Compresses bytes as one self-contained gzip member or zstd frame. Both
+    formats allow members/frames to be concatenated, so a file can be built
+    from blocks compressed independently (and in parallel) and still read back
+    with any standard decompressor. gzip members carry mtime 0, so output is
+    reproducible.
+    """
+    if compression == "none":
+        return data
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd output requires the zstandard package; use gzip instead")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    raise ValueError(f"Unknown compression '{compression}'; expected one of {', '.join(COMPRESSION_SUFFIXES)}")
+
+
+def shard_ranges(spec, shard_by=None, shard_rows=DEFAULT_SHARD_ROWS):
+    """
+    Deterministic split of a series into shards of consecutive rows, as a list
+    of (key, start, stop): shard_by "rows" gives shards of shard_rows rows keyed
+    00000, 00001, ...; "size" one shard per gearbox size keyed by its name;
+    None a single shard keyed None. Rows are in size order, so size shards are
+    contiguous.
+    """
+    grid = cached_grid(spec)
+    if shard_by is None:
+        return [(None, 0, grid.row_count)]
+    if shard_by == "rows":
+        if shard_rows < 1:
+            raise ValueError("shard_rows must be at least 1")
+        return [(f"{index:05d}", start, min(start + shard_rows, grid.row_count))
+                for index, start in enumerate(range(0, grid.row_count, shard_rows))]
+    if shard_by == "size":
+        rows_per_size = np.bincount(grid.pair_sizes, minlength=len(spec.sizes)) * grid.options_per_pair
+        ranges = []
+        start = 0
+        for size, size_rows in zip(spec.sizes, rows_per_size.tolist()):
+            if size_rows:
+                ranges.append((size, start, start + size_rows))
+                start += size_rows
+        return ranges
+    raise ValueError(f"Unknown shard_by '{shard_by}'; expected rows or size")
+
+
+def shard_file_name(spec, key, compression):
+    """
+    File name of a shard: the series CSV name, with the shard key before the
+    extension and the compression suffix after it.
+    """
+    stem = spec.csv_file_name[:-len(".csv")]
+    if key is not None:
+        stem = f"{stem}-{key}"
+    return f"{stem}.csv{COMPRESSION_SUFFIXES[compression]}"
+
+
+def manifest_file_name(spec):
+    return spec.csv_file_name[:-len(".csv")] + ".manifest.json"
+
+
+def _render_block(spec, start, stop, compression):
+    """
+    Worker task: rows [start, stop) of a series as compressed CSV bytes.
+    """
+    return compress_block(format_chunk(spec, start, stop).encode("utf-8"), compression)
+
+
+def _block_tasks(plans, chunk_size, compression):
+    for spec, ranges in plans:
+        for _, start, stop in ranges:
+            for block_start in range(start, stop, chunk_size):
+                yield spec, block_start, min(block_start + chunk_size, stop), compression
+
+
+def write_shards(series=None, output_dir=".", compression="gzip", shard_by="rows",
+                 shard_rows=DEFAULT_SHARD_ROWS, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Streams each requested series (every series by default) into output_dir as
+    compressed CSV shards, each with the header row, and writes a manifest
+    per series (<csv name>.manifest.json) listing every shard with its rows,
+    bytes, SHA-256 and first and last SKU, so loaders can ingest shards in
+    parallel and check them. Shards are split by shard_ranges(); shard files
+    of an earlier run that the new manifest no longer lists are removed.
+
+    Rows are rendered and compressed chunk_size rows at a time, as one block
+    write per chunk; with workers > 1 the blocks are produced on a process
+    pool and written in order. The bytes written depend on the rows, the shard
+    settings and chunk_size (compressed block boundaries) but not on workers.
+    Returns {series name: manifest}.
+    """
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression '{compression}'; expected one of {', '.join(COMPRESSION_SUFFIXES)}")
+    if compression == "zstd" and zstandard is None:
+        raise RuntimeError("zstd output requires the zstandard package; use gzip instead")
+    specs = resolve_series(series)
+    os.makedirs(output_dir, exist_ok=True)
+    plans = [(spec, shard_ranges(spec, shard_by, shard_rows)) for spec in specs]
+    header = compress_block(header_text().encode("utf-8"), compression)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        blocks = (_render_block(*task) for task in _block_tasks(plans, chunk_size, compression))
+        return _write_plans(plans, output_dir, compression, shard_by, chunk_size, header, blocks)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        blocks = ordered_results(pool, _render_block, _block_tasks(plans, chunk_size, compression), workers * 4)
+        return _write_plans(plans, output_dir, compression, shard_by, chunk_size, header, blocks)
+
+
+def _write_plans(plans, output_dir, compression, shard_by, chunk_size, header, blocks):
+    blocks = iter(blocks)
+    manifests = {}
+    for spec, ranges in plans:
+        grid = cached_grid(spec)
+        shards = []
+        for key, start, stop in ranges:
+            file_name = shard_file_name(spec, key, compression)
+            digest = hashlib.sha256()
+            size_in_bytes = 0
+            shard_blocks = chain([header], (next(blocks) for _ in range(start, stop, chunk_size)))
+            with atomic_open(os.path.join(output_dir, file_name), 'wb', newline=None) as shard_file:
+                for block in shard_blocks:
+                    shard_file.write(block)
+                    digest.update(block)
+                    size_in_bytes += len(block)
+            shards.append({
+                "file": file_name,
+                "key": key,
+                "rows": stop - start,
+                "bytes": size_in_bytes,
+                "sha256": digest.hexdigest(),
+                "first_sku": grid.rows(start, start + 1)[0][5] if stop > start else None,
+                "last_sku": grid.rows(stop - 1, stop)[0][5] if stop > start else None,
+            })
+        manifest = {
+            "series": spec.name,
+            "header": CSV_HEADER,
+            "compression": compression,
+            "shard_by": shard_by,
+            "rows": grid.row_count,
+            "shards": shards,
+        }
+        _replace_manifest(os.path.join(output_dir, manifest_file_name(spec)), manifest, output_dir)
+        manifests[spec.name] = manifest
+    return manifests
+
+
+def _replace_manifest(path, manifest, output_dir):
+    """
+    Writes the manifest and removes shard files listed only in the one it replaces.
+    """
+    current = {shard["file"] for shard in manifest["shards"]}
+    try:
+        with open(path) as manifest_file:
+            previous = {shard["file"] for shard in json.load(manifest_file).get("shards", [])}
+    except (OSError, ValueError):
+        previous = set()
+    with atomic_open(path) as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    for file_name in previous - current:
+        stale_path = os.path.join(output_dir, os.path.basename(file_name))
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
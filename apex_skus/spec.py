@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+
+# Options shared by most series
+SHAFT_OPTIONS = ("S1", "S2", "S3")
+BACKLASH_OPTIONS = ("P0", "P1", "P2")
+
+
+@dataclass(frozen=True)
+class ExclusionRule:
+    """
+    Marks every (size, ratio) pair in sizes x ratios as unavailable.
+    The description records where in the catalog the dashes come from.
+    """
+    description: str
+    sizes: tuple
+    ratios: tuple
+
+    def __post_init__(self):
+        object.__setattr__(self, "sizes", tuple(self.sizes))
+        object.__setattr__(self, "ratios", tuple(self.ratios))
+
+    def to_dict(self):
+        return {"description": self.description, "sizes": list(self.sizes), "ratios": list(self.ratios)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["description"], data["sizes"], data["ratios"])
+
+
+@dataclass(frozen=True)
+class SeriesSpec:
+    """
+    Declarative description of one gearbox series: its sizes, ratio tables,
+    ordering-code options and the rules that remove unavailable combinations.
+
+    shaft_options is None for series whose ordering code has no shaft segment
+    (AD, ADR); their rows carry "N/A" in the shaft column.
+    """
+    name: str
+    sizes: tuple
+    ratios_1_stage: tuple
+    ratios_2_stage: tuple
+    shaft_options: tuple = SHAFT_OPTIONS
+    backlash_options: tuple = BACKLASH_OPTIONS
+    exclusions: tuple = ()
+
+    def __post_init__(self):
+        for field in ("sizes", "ratios_1_stage", "ratios_2_stage", "backlash_options", "exclusions"):
+            object.__setattr__(self, field, tuple(getattr(self, field)))
+        if self.shaft_options is not None:
+            object.__setattr__(self, "shaft_options", tuple(self.shaft_options))
+        sizes, ratios = set(self.sizes), set(self.ratios)
+        for rule in self.exclusions:
+            unknown = [s for s in rule.sizes if s not in sizes] + [r for r in rule.ratios if r not in ratios]
+            if unknown:
+                raise ValueError(f"{self.name}: exclusion rule '{rule.description}' "
+                                 f"references unknown sizes/ratios {unknown}")
+
+    @property
+    def label(self):
+        """Series column value, e.g. "AB Series"."""
+        return f"{self.name} Series"
+
+    @property
+    def ratios(self):
+        """Sorted unique ratios across both stages, in generation order."""
+        return tuple(sorted(set(self.ratios_1_stage + self.ratios_2_stage)))
+
+    @property
+    def has_shaft(self):
+        return self.shaft_options is not None
+
+    @property
+    def csv_file_name(self):
+        return f"apex_dynamics_{self.name.lower()}_skus.csv"
+
+    def to_dict(self):
+        """
+        Plain-data form of the spec (JSON-serializable), in field order.
+        """
+        return {
+            "name": self.name,
+            "sizes": list(self.sizes),
+            "ratios_1_stage": list(self.ratios_1_stage),
+            "ratios_2_stage": list(self.ratios_2_stage),
+            "shaft_options": list(self.shaft_options) if self.has_shaft else None,
+            "backlash_options": list(self.backlash_options),
+            "exclusions": [rule.to_dict() for rule in self.exclusions],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Inverse of to_dict.
+        """
+        data = dict(data)
+        data["exclusions"] = [ExclusionRule.from_dict(rule) for rule in data.get("exclusions", ())]
+        return cls(**data)
+
+    def unavailable_combinations(self):
+        """Set of excluded (size, ratio) tuples, as the original scripts built it."""
+        return {(size, ratio) for rule in self.exclusions
+                for size in rule.sizes for ratio in rule.ratios}
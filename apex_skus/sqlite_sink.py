@@ -0,0 +1,185 @@
+import json
+import sqlite3
+
+import numpy as np
+
+from apex_skus.availability import compile_availability
+from apex_skus.engine import SeriesGrid, format_rows
+from apex_skus.registry import resolve_series
+from apex_skus.stream import DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS skus (
+    sku TEXT PRIMARY KEY,
+    series TEXT NOT NULL,
+    size TEXT NOT NULL,
+    ratio INTEGER NOT NULL,
+    shaft TEXT NOT NULL,
+    backlash TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS series_state (
+    series TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+"""
+
+# The primary key already indexes the SKU string
+INDEXES = {
+    "idx_skus_series_size_ratio_backlash": "skus (series, size, ratio, backlash)",
+}
+
+INSERT_SQL = ("INSERT INTO skus (sku, series, size, ratio, shaft, backlash) VALUES (?, ?, ?, ?, ?, ?) "
+              "ON CONFLICT (sku) DO UPDATE SET series = excluded.series, size = excluded.size, "
+              "ratio = excluded.ratio, shaft = excluded.shaft, backlash = excluded.backlash")
+
+
+def _db_rows(rows):
+    # CSV row order is Series, Gearbox Size, Ratio, Shaft Option, Backlash, SKU
+    return [(sku, series, size, int(ratio), shaft, backlash)
+            for series, size, ratio, shaft, backlash, sku in rows]
+
+
+def _series_state(spec):
+    """
+    What the database needs to remember about a series to update it later:
+    its options and the available ratios of every size.
+    """
+    return {
+        "label": spec.label,
+        "shaft_options": list(spec.shaft_options) if spec.has_shaft else None,
+        "backlash_options": list(spec.backlash_options),
+        "available": compile_availability(spec).to_dict()["available"],
+    }
+
+
+def _relax_pragmas(connection):
+    connection.execute("PRAGMA synchronous = OFF")
+    connection.execute("PRAGMA journal_mode = MEMORY")
+    connection.execute("PRAGMA temp_store = MEMORY")
+    connection.execute("PRAGMA cache_size = -65536")
+
+
+def _restore_pragmas(connection):
+    connection.execute("PRAGMA journal_mode = DELETE")
+    connection.execute("PRAGMA synchronous = FULL")
+
+
+def _insert_batches(connection, chunks, batch_size):
+    inserted = 0
+    batch = []
+    for chunk in chunks:
+        batch.extend(_db_rows(chunk))
+        if len(batch) >= batch_size:
+            connection.executemany(INSERT_SQL, batch)
+            inserted += len(batch)
+            batch = []
+    if batch:
+        connection.executemany(INSERT_SQL, batch)
+        inserted += len(batch)
+    return inserted
+
+
+def _pair_rows(spec, pairs):
+    """
+    CSV rows for every option of the given (size, ratio) pairs, in catalog order.
+    """
+    matrix = compile_availability(spec)
+    grid = SeriesGrid(spec)
+    indices = sorted((matrix.size_index(size), matrix.ratio_index(ratio)) for size, ratio in pairs)
+    if not indices:
+        return []
+    pair_sizes, pair_ratios = (np.repeat(np.array(column), grid.options_per_pair) for column in zip(*indices))
+    option = np.tile(np.arange(grid.options_per_pair), len(indices))
+    shaft, backlash = np.divmod(option, grid.backlash_count)
+    return format_rows(spec, pair_sizes, pair_ratios, shaft, backlash)
+
+
+def _load_series(connection, spec, batch_size, chunk_size):
+    connection.execute("DELETE FROM skus WHERE series = ?", (spec.label,))
+    return _insert_batches(connection, SeriesGrid(spec).iter_chunks(chunk_size), batch_size)
+
+
+def load_sqlite(db_path, series=None, batch_size=DEFAULT_BATCH_SIZE, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Bulk loads the requested series (every series by default) into the SQLite
+    database at db_path, replacing their existing rows.
+
+    The load runs in one transaction with relaxed durability pragmas, inserts
+    with executemany in batches of batch_size rows, and builds the indexes
+    after the data is in. Returns {series name: rows inserted}.
+    """
+    specs = resolve_series(series)
+    connection = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        _relax_pragmas(connection)
+        connection.executescript(SCHEMA)
+        connection.execute("BEGIN")
+        for index_name in INDEXES:
+            connection.execute(f"DROP INDEX IF EXISTS {index_name}")
+        counts = {}
+        for spec in specs:
+            counts[spec.name] = _load_series(connection, spec, batch_size, chunk_size)
+            connection.execute("INSERT OR REPLACE INTO series_state (series, state) VALUES (?, ?)",
+                               (spec.name, json.dumps(_series_state(spec))))
+        for index_name, target in INDEXES.items():
+            connection.execute(f"CREATE INDEX {index_name} ON {target}")
+        connection.execute("COMMIT")
+        _restore_pragmas(connection)
+    finally:
+        connection.close()
+    return counts
+
+
+def sync_sqlite(db_path, series=None, batch_size=DEFAULT_BATCH_SIZE, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Brings the database at db_path up to date with the current series specs,
+    touching only rows that changed.
+
+    For each series the stored availability is compared with the compiled one:
+    rows of (size, ratio) pairs that became unavailable are deleted and rows of
+    newly available pairs are upserted. A series that was never loaded, or
+    whose label, shaft or backlash options changed, is reloaded in full.
+    Returns {series name: {"mode": "unchanged"|"incremental"|"full",
+    "added": rows, "removed": rows}}.
+    """
+    specs = resolve_series(series)
+    connection = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        connection.executescript(SCHEMA)
+        stored = dict(connection.execute("SELECT series, state FROM series_state"))
+        _relax_pragmas(connection)
+        connection.execute("BEGIN")
+        for index_name, target in INDEXES.items():
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {target}")
+        report = {}
+        for spec in specs:
+            state = _series_state(spec)
+            old_state = json.loads(stored[spec.name]) if spec.name in stored else None
+            if old_state == state:
+                report[spec.name] = {"mode": "unchanged", "added": 0, "removed": 0}
+                continue
+            if old_state is None or any(old_state[key] != state[key]
+                                        for key in ("label", "shaft_options", "backlash_options")):
+                removed = 0
+                if old_state is not None:
+                    removed = connection.execute("DELETE FROM skus WHERE series = ?",
+                                                 (old_state["label"],)).rowcount
+                added = _load_series(connection, spec, batch_size, chunk_size)
+                report[spec.name] = {"mode": "full", "added": added, "removed": removed}
+            else:
+                old_pairs = {(size, ratio) for size, ratios in old_state["available"].items() for ratio in ratios}
+                new_pairs = {(size, ratio) for size, ratios in state["available"].items() for ratio in ratios}
+                removed = 0
+                for size, ratio in sorted(old_pairs - new_pairs):
+                    removed += connection.execute(
+                        "DELETE FROM skus WHERE series = ? AND size = ? AND ratio = ?",
+                        (spec.label, size, ratio)).rowcount
+                added = _insert_batches(connection, [_pair_rows(spec, new_pairs - old_pairs)], batch_size)
+                report[spec.name] = {"mode": "incremental", "added": added, "removed": removed}
+            connection.execute("INSERT OR REPLACE INTO series_state (series, state) VALUES (?, ?)",
+                               (spec.name, json.dumps(state)))
+        connection.execute("COMMIT")
+        _restore_pragmas(connection)
+    finally:
+        connection.close()
+    return report
@@ -0,0 +1,93 @@
+from apex_skus.availability import compile_availability
+from apex_skus.engine import option_count
+from apex_skus.registry import resolve_series
+
+
+def series_stats(spec):
+    """
+    Exact SKU counts for one series, derived arithmetically from the compiled
+    availability bitsets and the option counts; no row is built.
+
+    Ratios listed in both the 1-stage and 2-stage tables (e.g. ABR 12, 16, 20)
+    are counted under both stages, so by_stage may add up to more than total.
+    Each exclusion entry reports the (size, ratio) pairs and rows the rule
+    covers, and how many of those no other rule covers.
+    """
+    matrix = compile_availability(spec)
+    options = option_count(spec)
+    available_pairs = matrix.pair_count()
+    per_size = [matrix.pair_count(size) * options for size in spec.sizes]
+    per_ratio = [len(matrix.sizes_for(ratio)) * options for ratio in spec.ratios]
+
+    stage_ratios = {"1-stage": set(spec.ratios_1_stage), "2-stage": set(spec.ratios_2_stage)}
+    by_stage = {
+        stage: sum(count for ratio, count in zip(spec.ratios, per_ratio) if ratio in ratios)
+        for stage, ratios in stage_ratios.items()
+    }
+
+    if spec.has_shaft:
+        by_shaft = {shaft: available_pairs * len(spec.backlash_options) for shaft in spec.shaft_options}
+    else:
+        by_shaft = {"N/A": available_pairs * options}
+    by_backlash = {backlash: available_pairs * options // len(spec.backlash_options)
+                   for backlash in spec.backlash_options}
+
+    exclusions = []
+    for k, rule in enumerate(spec.exclusions):
+        pairs = matrix.rule_pair_count(k)
+        unique_pairs = matrix.rule_pair_count(k, unique=True)
+        exclusions.append({
+            "rule": rule.description,
+            "pairs": pairs,
+            "rows": pairs * options,
+            "unique_pairs": unique_pairs,
+            "unique_rows": unique_pairs * options,
+        })
+
+    grid_pairs = len(spec.sizes) * len(spec.ratios)
+    return {
+        "series": spec.name,
+        "total": available_pairs * options,
+        "grid_pairs": grid_pairs,
+        "available_pairs": available_pairs,
+        "excluded_pairs": grid_pairs - available_pairs,
+        "excluded_rows": (grid_pairs - available_pairs) * options,
+        "options_per_pair": options,
+        "by_size": {size: count for size, count in zip(spec.sizes, per_size)},
+        "by_ratio": {f"{ratio:03d}": count for ratio, count in zip(spec.ratios, per_ratio)},
+        "by_stage": by_stage,
+        "by_shaft": by_shaft,
+        "by_backlash": by_backlash,
+        "exclusions": exclusions,
+    }
+
+
+def catalog_stats(specs=None):
+    """
+    series_stats for each series (every series by default) plus the overall total.
+    """
+    per_series = [series_stats(spec) for spec in resolve_series(specs)]
+    return {
+        "total": sum(stats["total"] for stats in per_series),
+        "series": per_series,
+    }
+
+
+def format_stats(stats):
+    """
+    Renders catalog_stats output as a plain-text report.
+    """
+    lines = []
+    for series in stats["series"]:
+        lines.append(f"{series['series']} Series: {series['total']} SKUs "
+                     f"({series['available_pairs']} of {series['grid_pairs']} size/ratio pairs "
+                     f"x {series['options_per_pair']} options)")
+        for heading, key in (("Sizes", "by_size"), ("Stages", "by_stage"),
+                             ("Shaft", "by_shaft"), ("Backlash", "by_backlash")):
+            counts = ", ".join(f"{name}={count}" for name, count in series[key].items())
+            lines.append(f"  {heading}: {counts}")
+        for rule in series["exclusions"]:
+            lines.append(f"  Excluded by '{rule['rule']}': {rule['rows']} SKUs "
+                         f"({rule['pairs']} pairs, {rule['unique_pairs']} not covered by another rule)")
+    lines.append(f"Total: {stats['total']} SKUs")
+    return "\n".join(lines)
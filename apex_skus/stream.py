@@ -0,0 +1,81 @@
+import csv
+import os
+from contextlib import contextmanager
+from itertools import islice
+
+# Header row shared by every series CSV
+CSV_HEADER = ["Series", "Gearbox Size", "Ratio", "Shaft Option", "Backlash", "SKU"]
+
+# Number of rows handed to csv.writerows at a time
+DEFAULT_CHUNK_SIZE = 10000
+
+# Rows per file when sharded output is split by row count
+DEFAULT_SHARD_ROWS = 100000
+
+# Rows per executemany batch when loading SQLite
+DEFAULT_BATCH_SIZE = 50000
+
+
+def iter_chunks(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Groups an iterable of rows into lists of at most chunk_size rows.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_sku_csv(file_name, rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes the header and an iterable of SKU rows to file_name, pulling at most
+    chunk_size rows into memory at a time. Returns the number of rows written.
+    """
+    return write_chunks_csv(file_name, iter_chunks(rows, chunk_size))
+
+
+def write_chunks_csv(file_name, chunks):
+    """
+    Writes the header and an iterable of row chunks (lists of rows) to
+    file_name. Returns the number of rows written.
+    """
+    row_count = 0
+    with open(file_name, 'w', newline='') as csvfile:
+        csv_writer = csv.writer(csvfile)
+        csv_writer.writerow(CSV_HEADER)
+        for chunk in chunks:
+            csv_writer.writerows(chunk)
+            row_count += len(chunk)
+    return row_count
+
+
+@contextmanager
+def atomic_open(path, mode='w', newline=''):
+    """
+    Opens a temporary file next to path for writing and renames it over path
+    when the block exits cleanly, so readers never see a partial file. On error
+    the temporary file is removed and path is left untouched.
+    """
+    directory, base_name = os.path.split(os.path.abspath(path))
+    temp_path = os.path.join(directory, f".{base_name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, mode, newline=newline) as temp_file:
+            yield temp_file
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def write_series_csv(spec, file_name=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generates one series with the shared engine and streams it to its CSV file
+    (spec.csv_file_name unless file_name is given). Returns the row count.
+    """
+    from apex_skus.engine import SeriesGrid
+
+    file_name = spec.csv_file_name if file_name is None else file_name
+    return write_chunks_csv(file_name, SeriesGrid(spec).iter_chunks(chunk_size))
@@ -0,0 +1,147 @@
+import os
+import sys
+import time
+from importlib import import_module, reload
+from importlib.util import cache_from_source
+
+from apex_skus.incremental import regenerate
+from apex_skus.registry import SERIES_NAMES, series_module_name
+from apex_skus.stream import DEFAULT_CHUNK_SIZE
+
+DEFAULT_INTERVAL = 0.2
+DEFAULT_DEBOUNCE = 0.3
+
+
+def series_file(name):
+    """
+    Path of the module file defining a series.
+    """
+    package = import_module("apex_skus.series")
+    return os.path.join(os.path.dirname(package.__file__), f"{name.lower()}.py")
+
+
+def _stat(path):
+    """
+    (mtime_ns, size) of a file, or None if it does not exist (e.g. mid-save).
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SpecWatcher:
+    """
+    Keeps the generators loaded in one process and regenerates series CSVs
+    when their definition files in apex_skus/series/ change.
+
+    Files are polled every `interval` seconds. A change is acted on once the
+    changed files have been quiet for `debounce` seconds, so an editor's
+    save (or a burst of saves across several files) triggers one rebuild.
+    Only the changed series modules are reloaded; their new SPECs compile to
+    new availability matrices (compile_availability is cached per spec, so
+    unchanged series keep theirs, and the cache is bounded by
+    SPEC_CACHE_SIZE, so old versions are evicted over a long session), and
+    incremental.regenerate rewrites only series whose fingerprint changed,
+    e.g. not after a comment-only edit.
+    A module that fails to load is reported and its previous spec kept.
+    """
+
+    def __init__(self, series=None, output_dir=".", interval=DEFAULT_INTERVAL, debounce=DEFAULT_DEBOUNCE,
+                 workers=1, chunk_size=DEFAULT_CHUNK_SIZE, report=print):
+        self.names = [name.upper() for name in (series or SERIES_NAMES)]
+        self.output_dir = output_dir
+        self.interval = interval
+        self.debounce = debounce
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.report = report
+        self.paths = {name: series_file(name) for name in self.names}
+        self._seen = {name: _stat(path) for name, path in self.paths.items()}
+        self._pending = {}
+        self._last_change = None
+
+    def _specs(self, names):
+        return [import_module(series_module_name(name)).SPEC for name in names]
+
+    def start(self):
+        """
+        Brings output_dir up to date before watching; returns the regenerate report.
+        """
+        result = regenerate(self._specs(self.names), self.output_dir, self.workers, self.chunk_size)
+        for name, generated in result["generated"].items():
+            self.report(f"{name} Series: generated {generated['rows']} SKUs")
+        return result
+
+    def poll(self, now=None):
+        """
+        One polling step: records changed files and, once they have been quiet
+        for the debounce period, reloads and regenerates them. Returns the list
+        of per-series results of a rebuild, or None if nothing was rebuilt.
+        """
+        now = time.time() if now is None else now
+        for name, path in self.paths.items():
+            current = _stat(path)
+            if current is not None and current != self._seen[name]:
+                self._seen[name] = current
+                # The file's mtime is the save time the latency is measured from
+                self._pending[name] = current[0] / 1e9
+                self._last_change = now
+        if not self._pending or now - self._last_change < self.debounce:
+            return None
+        pending, self._pending = self._pending, {}
+        return self._rebuild(pending)
+
+    def _rebuild(self, pending):
+        reloaded = []
+        for name in pending:
+            module_name = series_module_name(name)
+            # Bytecode is validated by whole-second mtime and size, which two
+            # quick saves can share; always recompile from the source
+            try:
+                os.remove(cache_from_source(self.paths[name]))
+            except OSError:
+                pass
+            try:
+                if module_name in sys.modules:
+                    reload(sys.modules[module_name])
+                else:
+                    import_module(module_name)
+            except Exception as error:
+                self.report(f"{name} Series: not reloaded, keeping the previous definition ({error!r})")
+                continue
+            reloaded.append(name)
+        if not reloaded:
+            return []
+
+        started = time.perf_counter()
+        result = regenerate(self._specs(reloaded), self.output_dir, self.workers, self.chunk_size)
+        rebuild_seconds = time.perf_counter() - started
+        finished = time.time()
+        results = []
+        for name in reloaded:
+            entry = {"series": name, "latency": finished - pending[name], "rebuild_seconds": rebuild_seconds}
+            if name in result["generated"]:
+                entry["rows"] = result["generated"][name]["rows"]
+                self.report(f"{name} Series: {entry['rows']} SKUs regenerated {entry['latency']:.2f}s after save "
+                            f"(rebuild {entry['rebuild_seconds'] * 1000:.0f} ms)")
+            else:
+                entry["rows"] = None
+                self.report(f"{name} Series: definition unchanged, CSV kept")
+            results.append(entry)
+        return results
+
+    def run(self, stop=None):
+        """
+        Watches until interrupted, or until stop() returns True.
+        """
+        self.start()
+        self.report(f"Watching {len(self.paths)} series definitions in "
+                    f"{os.path.dirname(next(iter(self.paths.values())))}")
+        try:
+            while stop is None or not stop():
+                self.poll()
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
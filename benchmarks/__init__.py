@@ -0,0 +1,17 @@
+"""
+Benchmarks for the SKU tools; run each one with python -m benchmarks.<name>.
+"""
+
+
+def percentiles(timings_ns):
+    """
+    Summary of call latencies given in nanoseconds: call count and p50, p99,
+    max and mean in microseconds.
+    """
+    timings = sorted(timings_ns)
+
+    def pick(fraction):
+        return timings[min(len(timings) - 1, int(fraction * len(timings)))] / 1000
+
+    return {"calls": len(timings), "p50_us": pick(0.50), "p99_us": pick(0.99), "max_us": timings[-1] / 1000,
+            "mean_us": sum(timings) / len(timings) / 1000}
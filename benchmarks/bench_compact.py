@@ -0,0 +1,75 @@
+"""
+Memory per row of the full catalog held as lists of strings (one six-element
+list per row, as the generators build them) against CompactCatalog's code
+columns, measured with tracemalloc.
+
+    python -m benchmarks.bench_compact [--series AB ABR ...] [--json FILE]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from apex_skus.columnar import CompactCatalog
+from apex_skus.engine import iter_rows
+from apex_skus.registry import resolve_series
+
+
+def _measure(build):
+    """
+    (object, bytes still allocated after build returns, seconds).
+    """
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - started
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, allocated, seconds
+
+
+def run(series=None):
+    specs = resolve_series(series)
+    rows, list_bytes, list_seconds = _measure(lambda: [row for spec in specs for row in iter_rows(spec)])
+    row_count = len(rows)
+    del rows
+    catalog, compact_bytes, compact_seconds = _measure(lambda: CompactCatalog(specs))
+    assert len(catalog) == row_count
+
+    started = time.perf_counter()
+    for index in range(len(catalog)):
+        catalog.sku(index)
+    sku_seconds = time.perf_counter() - started
+    return {
+        "rows": row_count,
+        "lists": {"bytes": list_bytes, "bytes_per_row": list_bytes / row_count, "build_seconds": list_seconds},
+        "compact": {"bytes": compact_bytes, "bytes_per_row": compact_bytes / row_count,
+                    "code_bytes": catalog.nbytes, "build_seconds": compact_seconds,
+                    "sku_on_demand_us": sku_seconds / row_count * 1e6},
+        "reduction": list_bytes / compact_bytes,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--series", nargs="+", type=str.upper, help="series to load (default: all)")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.series)
+    lists, compact = results["lists"], results["compact"]
+    print(f"{results['rows']} rows")
+    print(f"   lists: {lists['bytes'] / 1024:,.0f} KiB, {lists['bytes_per_row']:.1f} bytes/row")
+    print(f" compact: {compact['bytes'] / 1024:,.0f} KiB, {compact['bytes_per_row']:.1f} bytes/row "
+          f"({compact['code_bytes'] / results['rows']:.0f} bytes/row of codes), "
+          f"SKU on demand {compact['sku_on_demand_us']:.2f} us")
+    print(f"{results['reduction']:.0f}x less memory")
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Generation throughput: each generator function end to end, each series stage
+by stage (exclusion building, enumeration, formatting, writing), and
+synthetic copies of a series scaled 10x, 100x and 1000x in sizes and options.
+
+Results are written as JSON; pass an earlier results file with --compare to
+see the change of every timing and flag regressions.
+
+    python -m benchmarks.bench_generate [--json FILE] [--compare OLD.json] [--scales 10x 100x]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+from apex_skus import generators
+from apex_skus.availability import compile_availability
+from apex_skus.metrics import write_staged_csv
+from apex_skus.registry import SERIES_NAMES, get_series
+from apex_skus.spec import ExclusionRule, SeriesSpec
+from apex_skus.stream import DEFAULT_CHUNK_SIZE
+
+GENERATORS = ("generate_apex_skus", "generate_apex_af_afr_skus",
+              "generate_apex_afx_afxr_skus", "generate_apex_ad_adr_ads_skus")
+
+# Multipliers of (sizes, backlash options) for each synthetic scale; rows grow by their product
+SCALES = {"10x": (10, 1), "100x": (10, 10), "1000x": (100, 10)}
+
+# A timing this much slower than the compared run is reported as a regression
+REGRESSION_THRESHOLD = 1.10
+
+# Timings shorter than this are mostly timer noise and never flagged
+MIN_COMPARED_SECONDS = 0.002
+
+
+def scale_spec(spec, size_factor, option_factor):
+    """
+    Synthetic spec with size_factor copies of every size (each with the same
+    exclusions) and option_factor copies of every backlash option.
+    """
+    def copies(values, factor):
+        return [value if copy == 0 else f"{value}X{copy}" for copy in range(factor) for value in values]
+
+    return SeriesSpec(
+        name=f"{spec.name}{size_factor * option_factor}X",
+        sizes=copies(spec.sizes, size_factor),
+        ratios_1_stage=spec.ratios_1_stage,
+        ratios_2_stage=spec.ratios_2_stage,
+        shaft_options=spec.shaft_options,
+        backlash_options=copies(spec.backlash_options, option_factor),
+        exclusions=[ExclusionRule(rule.description, copies(rule.sizes, size_factor), rule.ratios)
+                    for rule in spec.exclusions],
+    )
+
+
+def time_stages(spec, output_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Seconds spent in each stage of generating one series into output_path,
+    as measured by metrics.write_staged_csv. The availability cache is cleared
+    first, so "exclusions" times a cold compile on every repeat.
+    """
+    compile_availability.cache_clear()
+    result = write_staged_csv(spec, output_path, chunk_size)
+    return {"rows": result["rows"], "bytes": result["bytes"], "stages": result["phases"]}
+
+
+def _best_of(repeats, measure):
+    """
+    Runs measure() repeats times and keeps the fastest result of each timing.
+    """
+    best = None
+    for _ in range(repeats):
+        result = measure()
+        if best is None:
+            best = result
+        else:
+            best["stages"] = {stage: min(seconds, result["stages"][stage])
+                              for stage, seconds in best["stages"].items()}
+    best["seconds"] = sum(best["stages"].values())
+    best["rows_per_second"] = best["rows"] / best["seconds"] if best["seconds"] else 0.0
+    return best
+
+
+def bench_series(spec, directory, repeats, chunk_size=DEFAULT_CHUNK_SIZE):
+    path = os.path.join(directory, spec.csv_file_name)
+    return _best_of(repeats, lambda: time_stages(spec, path, chunk_size))
+
+
+def bench_generators(directory, repeats):
+    """
+    Best wall time of each generator function, run in directory as the scripts would.
+    """
+    results = {}
+    previous = os.getcwd()
+    os.chdir(directory)
+    try:
+        for name in GENERATORS:
+            timings = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    getattr(generators, name)()
+                timings.append(time.perf_counter() - started)
+            results[name] = {"seconds": min(timings)}
+    finally:
+        os.chdir(previous)
+    return results
+
+
+def _environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"commit": commit, "python": platform.python_version(), "numpy": np.__version__,
+            "machine": platform.machine(), "cpus": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+
+
+def run(repeats=3, scales=tuple(SCALES), scale_series="AB", chunk_size=DEFAULT_CHUNK_SIZE):
+    with tempfile.TemporaryDirectory() as directory:
+        results = {"environment": _environment(), "chunk_size": chunk_size,
+                   "generators": bench_generators(directory, repeats),
+                   "series": {name: bench_series(get_series(name), directory, repeats, chunk_size)
+                              for name in SERIES_NAMES},
+                   "scaled": {}}
+        base = get_series(scale_series)
+        for scale in scales:
+            spec = scale_spec(base, *SCALES[scale])
+            # The largest scale runs once; its timings are long enough to be stable
+            scale_repeats = 1 if scale == "1000x" else repeats
+            results["scaled"][f"{scale_series} {scale}"] = bench_series(spec, directory, scale_repeats, chunk_size)
+    return results
+
+
+def _timings(results):
+    """
+    Flattens a results dict to {label: seconds} for comparison.
+    """
+    flat = {f"generator {name}": result["seconds"] for name, result in results["generators"].items()}
+    for group in ("series", "scaled"):
+        for name, result in results[group].items():
+            flat[f"{name} total"] = result["seconds"]
+            for stage, seconds in result["stages"].items():
+                flat[f"{name} {stage}"] = seconds
+    return flat
+
+
+def compare(old, new, threshold=REGRESSION_THRESHOLD):
+    """
+    [(label, old seconds, new seconds, ratio, regressed)] for timings in both runs.
+    """
+    old_timings, new_timings = _timings(old), _timings(new)
+    rows = []
+    for label, seconds in new_timings.items():
+        if label in old_timings and old_timings[label] > 0:
+            ratio = seconds / old_timings[label]
+            regressed = ratio > threshold and seconds >= MIN_COMPARED_SECONDS
+            rows.append((label, old_timings[label], seconds, ratio, regressed))
+    return rows
+
+
+def _print_results(results):
+    for name, result in results["generators"].items():
+        print(f"{name:>30}: {result['seconds'] * 1000:8.1f} ms")
+    for group in ("series", "scaled"):
+        for name, result in results[group].items():
+            stages = ", ".join(f"{stage} {seconds * 1000:.1f}" for stage, seconds in result["stages"].items())
+            print(f"{name:>10}: {result['rows']:>9} rows, {result['seconds'] * 1000:8.1f} ms "
+                  f"({result['rows_per_second']:,.0f} rows/s; {stages} ms)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=3, help="runs per measurement, best kept (default: %(default)s)")
+    parser.add_argument("--scales", nargs="*", choices=tuple(SCALES), default=list(SCALES),
+                        help="synthetic scales to run (default: all)")
+    parser.add_argument("--scale-series", type=str.upper, choices=SERIES_NAMES, default="AB",
+                        help="series the synthetic specs are scaled from (default: %(default)s)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="rows per chunk (default: %(default)s)")
+    parser.add_argument("--json", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="OLD_JSON", help="compare with the results of an earlier run")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="slowdown ratio reported as a regression (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeats, args.scales, args.scale_series, args.chunk_size)
+    _print_results(results)
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(results, json_file, indent=2)
+    if args.compare:
+        with open(args.compare) as json_file:
+            old = json.load(json_file)
+        regressions = 0
+        print(f"\nCompared with {args.compare} ({old['environment'].get('commit')}):")
+        for label, old_seconds, new_seconds, ratio, regressed in compare(old, results, args.threshold):
+            regressions += regressed
+            marker = "  REGRESSION" if regressed else ""
+            print(f"{label:>40}: {old_seconds * 1000:8.1f} -> {new_seconds * 1000:8.1f} ms ({ratio:.2f}x){marker}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,62 @@
+"""
+Lookup latency of SkuPrefixIndex: typeahead completions and full-code
+validation, over every prefix of a uniform sample of catalog SKUs plus a set
+of invalid codes.
+
+    python -m benchmarks.bench_prefix [--samples N] [--json FILE]
+"""
+import argparse
+import json
+import time
+
+from apex_skus.codec import SkuCodec
+from apex_skus.prefix import SkuPrefixIndex
+
+from benchmarks import percentiles
+
+INVALID_CODES = ["ADR090-140-P1", "AB060A-003-S1-P0", "AB042-003-P0", "AFXR075-999-S1-P0", "ZZ000-010-S1-P0"]
+
+
+def _time_calls(function, arguments):
+    timings = []
+    for argument in arguments:
+        started = time.perf_counter_ns()
+        function(argument)
+        timings.append(time.perf_counter_ns() - started)
+    return timings
+
+
+def run(samples=2000, seed=0):
+    started = time.perf_counter()
+    index = SkuPrefixIndex()
+    build_seconds = time.perf_counter() - started
+
+    codes = SkuCodec().sample(samples, seed=seed) + INVALID_CODES
+    prefixes = [code[:end] for code in codes for end in range(len(code) + 1)]
+    return {
+        "build_ms": build_seconds * 1000,
+        "complete": percentiles(_time_calls(index.complete, prefixes)),
+        "next_chars": percentiles(_time_calls(index.next_chars, prefixes)),
+        "validate": percentiles(_time_calls(index.validate, codes)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=2000, help="SKUs to sample (default: %(default)s)")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.samples)
+    print(f"index build: {results['build_ms']:.2f} ms")
+    for name in ("complete", "next_chars", "validate"):
+        timing = results[name]
+        print(f"{name:>10}: {timing['calls']} calls, p50 {timing['p50_us']:.1f} us, "
+              f"p99 {timing['p99_us']:.1f} us, max {timing['max_us']:.1f} us")
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
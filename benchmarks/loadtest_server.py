@@ -0,0 +1,151 @@
+"""
+Load test of the local lookup service: concurrent keep-alive clients send a
+mix of validate, count, list, query and complete requests, then batches, and
+the per-request latency percentiles are reported.
+
+The service runs in a separate process started from this script, as it would
+in use; pass --port or --unix to test a server that is already running.
+
+    python -m benchmarks.loadtest_server [--connections N] [--requests N] [--json FILE]
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from urllib.parse import urlencode
+
+from apex_skus.codec import SkuCodec
+from apex_skus.server import CatalogClient
+
+from benchmarks import percentiles
+from benchmarks.bench_prefix import INVALID_CODES
+
+
+def _request_mix(samples, seed):
+    """
+    (kind, path) pairs covering every endpoint, in a reproducible random order;
+    size lookups only use sampled codes, so every request should answer 200.
+    """
+    rng = random.Random(seed)
+    sampled = SkuCodec().sample(samples, seed=seed)
+    codes = sampled + INVALID_CODES
+    requests = []
+    for code in codes:
+        requests.append(("validate", "/validate?" + urlencode({"sku": code})))
+        requests.append(("complete", "/complete?" + urlencode({"prefix": code[:rng.randint(1, len(code))],
+                                                              "limit": 20})))
+    for code in sampled:
+        size = code.split("-")[0]
+        requests.append(("list", "/list?" + urlencode({"size": size})))
+        requests.append(("count", "/count?" + urlencode({"size": size, "backlash": "P1"})))
+        requests.append(("query", "/query?" + urlencode({"size": size, "ratio_max": 20, "limit": 50})))
+    rng.shuffle(requests)
+    return codes, requests
+
+
+async def _client_loop(client, requests, timings):
+    for kind, path in requests:
+        started = time.perf_counter_ns()
+        status, _ = await client.request(path)
+        timings.setdefault(kind, []).append(time.perf_counter_ns() - started)
+        if status != 200:
+            raise RuntimeError(f"{path} answered HTTP {status}")
+
+
+async def _batch_loop(client, codes, batch_size, timings):
+    for start in range(0, len(codes), batch_size):
+        batch = [{"op": "validate", "sku": code} for code in codes[start:start + batch_size]]
+        started = time.perf_counter_ns()
+        status, _ = await client.request("/batch", batch)
+        timings.append(time.perf_counter_ns() - started)
+        if status != 200:
+            raise RuntimeError(f"/batch answered HTTP {status}")
+
+
+async def _load_test(address, connections, requests, codes, batch_size):
+    clients = [CatalogClient(*address) for _ in range(connections)]
+    for client in clients:
+        await client.connect()
+    timings = {}
+    started = time.perf_counter()
+    await asyncio.gather(*(_client_loop(client, requests[i::connections], timings)
+                           for i, client in enumerate(clients)))
+    seconds = time.perf_counter() - started
+
+    batch_timings = []
+    await asyncio.gather(*(_batch_loop(client, codes[i::connections], batch_size, batch_timings)
+                           for i, client in enumerate(clients)))
+    for client in clients:
+        await client.close()
+
+    every_request = [timing for kind_timings in timings.values() for timing in kind_timings]
+    results = {kind: percentiles(kind_timings) for kind, kind_timings in sorted(timings.items())}
+    results["all"] = percentiles(every_request)
+    results["all"]["requests_per_second"] = len(every_request) / seconds
+    results["batch"] = percentiles(batch_timings)
+    results["batch"]["batch_size"] = batch_size
+    return results
+
+
+def _start_server(unix_path):
+    """
+    Starts `python -m apex_skus serve` and returns (process, client address).
+    """
+    command = [sys.executable, "-m", "apex_skus", "serve"]
+    command += ["--unix", unix_path] if unix_path else ["--port", "0"]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline().strip()
+    if not line:
+        process.kill()
+        raise RuntimeError("the service did not start")
+    if unix_path:
+        return process, ("127.0.0.1", None, unix_path)
+    host, port = line.rsplit(" ", 1)[1].rsplit(":", 1)
+    return process, (host, int(port))
+
+
+def run(connections=8, samples=500, batch_size=100, seed=0, port=None, unix_path=None, spawn=True):
+    codes, requests = _request_mix(samples, seed)
+    process = None
+    if spawn:
+        process, address = _start_server(unix_path)
+    else:
+        address = ("127.0.0.1", None, unix_path) if unix_path else ("127.0.0.1", port)
+    try:
+        return asyncio.run(_load_test(address, connections, requests, codes, batch_size))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--connections", type=int, default=8, help="concurrent keep-alive clients (default: %(default)s)")
+    parser.add_argument("--requests", type=int, default=500,
+                        help="SKUs to sample; each yields one request per endpoint (default: %(default)s)")
+    parser.add_argument("--batch-size", type=int, default=100, help="validations per /batch request (default: %(default)s)")
+    parser.add_argument("--port", type=int, help="test the service already listening on this port")
+    parser.add_argument("--unix", metavar="PATH", help="use a Unix socket (of a running service with --port omitted "
+                                                       "and --no-spawn, otherwise of the one started here)")
+    parser.add_argument("--no-spawn", action="store_true", help="do not start a service; connect to a running one")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    spawn = not args.no_spawn and args.port is None
+    results = run(args.connections, args.requests, args.batch_size, port=args.port, unix_path=args.unix, spawn=spawn)
+    for name, timing in results.items():
+        print(f"{name:>9}: {timing['calls']} calls, p50 {timing['p50_us']:.1f} us, "
+              f"p99 {timing['p99_us']:.1f} us, max {timing['max_us']:.1f} us")
+    print(f"throughput: {results['all']['requests_per_second']:,.0f} requests/s "
+          f"over {args.connections} connections")
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
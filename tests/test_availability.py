@@ -0,0 +1,25 @@
+from dataclasses import replace
+
+from apex_skus.availability import SPEC_CACHE_SIZE, compile_availability
+from apex_skus.registry import get_series
+
+
+def test_compiled_specs_are_bounded():
+    base = get_series("AB")
+    compile_availability.cache_clear()
+    for version in range(SPEC_CACHE_SIZE * 3):
+        compile_availability(replace(base, name=f"AB{version}"))
+    assert compile_availability.cache_info().currsize == SPEC_CACHE_SIZE
+    assert compile_availability(base) is compile_availability(base)
+
+
+def test_counts_agree_with_the_array():
+    spec = get_series("ABR")
+    matrix = compile_availability(spec)
+    array = matrix.to_array()
+    assert matrix.pair_count() == array.sum()
+    assert [matrix.pair_count(size) for size in spec.sizes] == array.sum(axis=1).tolist()
+    assert [len(matrix.sizes_for(ratio)) for ratio in spec.ratios] == array.sum(axis=0).tolist()
+    removed = sum(matrix.rule_pair_count(k, unique=True) for k in range(len(spec.exclusions)))
+    assert removed <= array.size - array.sum() <= sum(matrix.rule_pair_count(k)
+                                                      for k in range(len(spec.exclusions)))
@@ -0,0 +1,36 @@
+import csv
+import io
+
+import pytest
+
+from apex_skus.bulk_validate import VERDICT_CSV_HEADER, validate_lines
+
+LINES = ["AB042-003-S1-P0\n", "\n", "ADR090-140-P1\n", "  AF060-004-S2-P1  \n", "ZZ1-003-P1\n",
+         "AB042-003-P1\n", "   \n", "AB042-003-S1-P0\n"] * 50
+
+
+def verdicts(workers, chunk_lines):
+    out = io.StringIO()
+    report = validate_lines(LINES, out, workers=workers, chunk_lines=chunk_lines)
+    return out.getvalue(), report
+
+
+@pytest.mark.parametrize("chunk_lines", [1, 7, 1000])
+def test_verdicts_do_not_depend_on_workers(chunk_lines):
+    text, report = verdicts(1, chunk_lines)
+    assert verdicts(2, chunk_lines)[0] == text
+    assert (report["lines"], report["valid"], report["invalid"]) == (400, 150, 250)
+
+
+def test_verdict_rows():
+    text, _ = verdicts(1, 1000)
+    rows = list(csv.reader(io.StringIO(text)))
+    assert rows[0] == VERDICT_CSV_HEADER
+    assert rows[1] == ["1", "AB042-003-S1-P0", "valid", "AB", ""]
+    assert rows[2] == ["2", "", "invalid", "", "empty line"]
+    assert rows[3][:3] == ["3", "ADR090-140-P1", "invalid"]
+    assert "2-stage ratios 140 and 200 up to ADR110" in rows[3][4]
+    assert rows[4][:4] == ["4", "AF060-004-S2-P1", "valid", "AF"]
+    assert rows[5] == ["5", "ZZ1-003-P1", "invalid", "", "unknown gearbox size 'ZZ1'"]
+    assert rows[7] == ["7", "", "invalid", "", "empty line"]
+    assert len(rows) == len(LINES) + 1
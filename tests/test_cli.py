@@ -0,0 +1,44 @@
+import pytest
+
+from apex_skus.cli import build_parser, main
+
+
+@pytest.mark.parametrize("argv", [
+    ["generate", "--chunk-size", "0"],
+    ["generate", "--workers", "-1"],
+    ["generate", "--shard-rows", "0"],
+    ["master", "--run-rows", "0"],
+    ["validate", "orders.txt", "--chunk-lines", "-5"],
+    ["watch", "--chunk-size", "abc"],
+])
+def test_counts_must_be_positive(argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        build_parser().parse_args(argv)
+    assert exit_info.value.code == 2
+    assert "error: argument" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("argv", [
+    ["generate", "--incremental", "--compression", "gzip"],
+    ["generate", "--force", "--shard-by", "size"],
+    ["generate", "--metrics", "-", "--incremental"],
+    ["generate", "--metrics", "-", "--compression", "gzip"],
+])
+def test_generate_rejects_options_it_would_ignore(argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(argv)
+    assert exit_info.value.code == 2
+    assert "cannot be combined" in capsys.readouterr().err
+
+
+def test_generate_rejects_profile_without_metrics(capsys):
+    with pytest.raises(SystemExit):
+        main(["generate", "--profile", "cprofile"])
+    assert "--profile needs --metrics" in capsys.readouterr().err
+
+
+def test_diff_rejects_a_missing_spec_source(tmp_path, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        build_parser().parse_args(["diff", "current", str(tmp_path / "typo.json")])
+    assert exit_info.value.code == 2
+    assert "no such spec file or directory" in capsys.readouterr().err
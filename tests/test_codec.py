@@ -0,0 +1,29 @@
+import pytest
+
+from apex_skus.codec import InvalidSkuError, SkuCodec
+from apex_skus.engine import iter_rows
+from apex_skus.registry import resolve_series
+
+
+@pytest.fixture(scope="module")
+def codec():
+    return SkuCodec()
+
+
+def test_ids_follow_the_concatenated_catalog(codec):
+    skus = [row[5] for spec in resolve_series() for row in iter_rows(spec)]
+    assert len(codec) == len(skus) == 13362
+    for sku_id, sku in enumerate(skus):
+        assert codec.rank(sku) == sku_id
+        assert codec.unrank(sku_id) == sku
+
+
+def test_excluded_code_has_no_id(codec):
+    with pytest.raises(InvalidSkuError):
+        codec.rank("ADR090-140-P1")
+
+
+@pytest.mark.parametrize("sku_id", [-1, 13362])
+def test_unrank_out_of_range(codec, sku_id):
+    with pytest.raises(IndexError):
+        codec.unrank(sku_id)
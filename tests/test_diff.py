@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+from dataclasses import replace
+
+import pytest
+
+from apex_skus.diff import DIFF_CSV_HEADER, iter_catalog_diff, write_diff
+from apex_skus.engine import iter_rows
+from apex_skus.registry import load_specs
+from apex_skus.spec import ExclusionRule, SeriesSpec
+
+
+def drop_size(spec, size):
+    rules = [ExclusionRule(rule.description, [s for s in rule.sizes if s != size], rule.ratios)
+             for rule in spec.exclusions]
+    return replace(spec, sizes=[s for s in spec.sizes if s != size], exclusions=rules)
+
+
+def edited(specs, name, edit):
+    return {**specs, name: edit(specs[name])}
+
+
+CURRENT = load_specs("current")
+
+EDITS = {
+    "rule removed": edited(CURRENT, "ADR", lambda spec: replace(spec, exclusions=spec.exclusions[:1])),
+    "ratio added": edited(CURRENT, "AB", lambda spec: replace(spec, ratios_1_stage=spec.ratios_1_stage + (11,))),
+    "size dropped": edited(CURRENT, "AF", lambda spec: drop_size(spec, spec.sizes[0])),
+    "series added": {**CURRENT, "ZZ": SeriesSpec("ZZ", ["ZZ010", "ZZ020"], [3, 5], [15])},
+    "series dropped": {name: spec for name, spec in CURRENT.items() if name != "ADS"},
+    "shaft changed": edited(CURRENT, "AFX", lambda spec: replace(spec, shaft_options=("S1", "S4"))),
+}
+
+
+def catalog(specs):
+    return {tuple(row) for spec in specs.values() for row in iter_rows(spec)}
+
+
+def expected_changes(old_specs, new_specs):
+    old_rows, new_rows = catalog(old_specs), catalog(new_specs)
+    return ({("removed",) + row for row in old_rows - new_rows}
+            | {("added",) + row for row in new_rows - old_rows})
+
+
+@pytest.mark.parametrize("edit", list(EDITS))
+@pytest.mark.parametrize("direction", ["forward", "backward"])
+def test_diff_is_the_set_difference(edit, direction):
+    old_specs, new_specs = (CURRENT, EDITS[edit]) if direction == "forward" else (EDITS[edit], CURRENT)
+    expected = expected_changes(old_specs, new_specs)
+    assert expected
+
+    out = io.StringIO()
+    counts = write_diff(iter_catalog_diff(old_specs, new_specs), out, "csv")
+    lines = list(csv.reader(io.StringIO(out.getvalue())))
+    assert lines[0] == DIFF_CSV_HEADER
+    assert len(lines) - 1 == len(expected)
+    assert {tuple(line) for line in lines[1:]} == expected
+
+    out = io.StringIO()
+    assert write_diff(iter_catalog_diff(old_specs, new_specs), out, "jsonl") == counts
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert {tuple(record.values()) for record in records} == expected
+    assert counts == {"added": sum(change[0] == "added" for change in expected),
+                      "removed": sum(change[0] == "removed" for change in expected)}
+
+
+def test_unchanged_specs_have_no_diff():
+    assert list(iter_catalog_diff(CURRENT, load_specs("current"))) == []
@@ -0,0 +1,56 @@
+import hashlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+from apex_skus.registry import get_series
+from apex_skus.stream import write_series_csv
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# SHA-256 of the CSVs written by the original scripts, before any refactoring;
+# every way of generating a series must reproduce them byte for byte
+EXPECTED_SHA256 = {
+    "AB": "6616d64d81e091a559724df40b6eb8618fbe2acf2b7b35054b321edefa7757ed",
+    "ABR": "530dad736a032fa8d8fc5e1b2ed21c99e0b07b14955f8b19ccfdd736f222db08",
+    "AF": "adb7e0be057940ba5272802ba6db144634a43be1becb02cb83d734790058321e",
+    "AFR": "e2faf1e6938515b8f413642c9f9ab547026eaccb1b79fa1ae25aa1ad0c6b27c7",
+    "AFX": "8210a7a92a54785964e390518cd3c026b9e3c8cba449dd61206effc677357cd5",
+    "AFXR": "90de3f6cf98d8be12fb2f8c8a1d28a3ee6f06fe630904d889391d2cfeb1ac699",
+    "AD": "7e51a61b16c4237933f6f3eaa91df347c03986ed79aa9a978c0c0cad1108621f",
+    "ADR": "2d8cbb5a34e4c39d8d5b230d82188c8aa64864d27a075da9f4a72e65ddb8a524",
+    "ADS": "902c0dedad61181e0096e3a457a41d50e9747a867833670a124aebe51447d6f7",
+}
+
+SCRIPTS = {
+    "AB-ABR-SKUs.py": ["AB", "ABR"],
+    "AF-AFR-SKUs.py": ["AF", "AFR"],
+    "AFX-AFXR-SKUs.py": ["AFX", "AFXR"],
+    "AD-ADR-SDS-SKUs.py": ["AD", "ADR", "ADS"],
+}
+
+
+def sha256_of(path):
+    with open(path, "rb") as csvfile:
+        return hashlib.sha256(csvfile.read()).hexdigest()
+
+
+@pytest.mark.parametrize("script", sorted(SCRIPTS))
+def test_scripts_write_the_original_csvs(script, tmp_path):
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    subprocess.run([sys.executable, os.path.join(REPO_ROOT, script)], cwd=tmp_path, env=env,
+                   check=True, capture_output=True)
+    written = {}
+    for name in SCRIPTS[script]:
+        written[name] = sha256_of(tmp_path / get_series(name).csv_file_name)
+    assert written == {name: EXPECTED_SHA256[name] for name in SCRIPTS[script]}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 997, 10000])
+def test_write_series_csv_is_independent_of_chunk_size(chunk_size, tmp_path):
+    for name, expected in EXPECTED_SHA256.items():
+        path = tmp_path / f"{name}.csv"
+        write_series_csv(get_series(name), str(path), chunk_size=chunk_size)
+        assert sha256_of(path) == expected, name
@@ -0,0 +1,12 @@
+from apex_skus.importtime import imported_modules, measure_import_time
+
+
+def test_import_is_fast():
+    assert measure_import_time() < 0.05
+
+
+def test_import_loads_no_series_and_no_numpy():
+    modules = imported_modules()
+    assert "apex_skus" in modules
+    assert "numpy" not in modules
+    assert not [name for name in modules if name.startswith("apex_skus.series")]
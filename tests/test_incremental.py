@@ -0,0 +1,57 @@
+import csv
+import os
+from dataclasses import replace
+
+from apex_skus.incremental import regenerate
+from apex_skus.parallel import generate_series
+from apex_skus.registry import get_series, resolve_series
+
+
+def csv_rows(path):
+    with open(path, newline="") as csvfile:
+        return sum(1 for _ in csv.reader(csvfile)) - 1
+
+
+def test_second_run_skips_everything(tmp_path):
+    first = regenerate(None, str(tmp_path))
+    assert sorted(first["generated"]) == sorted(spec.name for spec in resolve_series())
+    second = regenerate(None, str(tmp_path))
+    assert second["generated"] == {}
+    assert sorted(second["skipped"]) == sorted(first["generated"])
+    assert second["seconds_saved"] == sum(entry["seconds"] for entry in first["generated"].values())
+
+
+def test_changed_spec_regenerates_only_that_series(tmp_path):
+    specs = resolve_series()
+    regenerate(specs, str(tmp_path))
+    adr = get_series("ADR")
+    edited = [replace(adr, exclusions=adr.exclusions[1:]) if spec.name == "ADR" else spec for spec in specs]
+    report = regenerate(edited, str(tmp_path))
+    assert list(report["generated"]) == ["ADR"]
+    assert "ADR" not in report["skipped"]
+
+
+def test_force_regenerates_all(tmp_path):
+    regenerate(["AB", "ABR"], str(tmp_path))
+    report = regenerate(["AB", "ABR"], str(tmp_path), force=True)
+    assert sorted(report["generated"]) == ["AB", "ABR"]
+    assert report["skipped"] == []
+
+
+def test_missing_csv_is_regenerated(tmp_path):
+    regenerate(["AB", "ABR"], str(tmp_path))
+    os.remove(tmp_path / get_series("AB").csv_file_name)
+    report = regenerate(["AB", "ABR"], str(tmp_path))
+    assert list(report["generated"]) == ["AB"]
+    assert report["skipped"] == ["ABR"]
+
+
+def test_csv_rewritten_outside_the_manifest_is_regenerated(tmp_path):
+    adr = get_series("ADR")
+    regenerate([adr], str(tmp_path))
+    generate_series([replace(adr, exclusions=adr.exclusions[:1])], str(tmp_path), workers=1)
+    path = tmp_path / adr.csv_file_name
+    assert csv_rows(path) == 279
+    report = regenerate([adr], str(tmp_path))
+    assert list(report["generated"]) == ["ADR"]
+    assert csv_rows(path) == 255
@@ -0,0 +1,34 @@
+import csv
+
+import pytest
+
+from apex_skus.master import merge_catalog
+from apex_skus.stream import CSV_HEADER
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(rows)
+    return str(path)
+
+
+def row(series, sku):
+    return [series, sku.split("-")[0], "003", "S1", "P0", sku]
+
+
+@pytest.mark.parametrize("run_rows", [1, 1000])
+def test_repeats_of_a_colliding_series_are_duplicates(tmp_path, run_rows):
+    first = write_csv(tmp_path / "first.csv", [row("A Series", "X1-003-S1-P0"), row("A Series", "X2-003-S1-P0")])
+    second = write_csv(tmp_path / "second.csv", [row("B Series", "X1-003-S1-P0"), row("B Series", "X1-003-S1-P0"),
+                                                 row("B Series", "X3-003-S1-P0")])
+    output = tmp_path / "master.csv"
+    report = merge_catalog(str(output), csv_files=[first, second], run_rows=run_rows, temp_dir=str(tmp_path))
+    assert report["input_rows"] == 5
+    assert report["rows"] == 3
+    assert report["collisions"] == 1
+    assert report["duplicates"] == 1
+    with open(output, newline="") as csvfile:
+        skus = [line[5] for line in csv.reader(csvfile)][1:]
+    assert skus == ["X1-003-S1-P0", "X2-003-S1-P0", "X3-003-S1-P0"]
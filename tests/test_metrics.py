@@ -0,0 +1,19 @@
+import hashlib
+
+from apex_skus.metrics import PHASES, RunMetrics
+from apex_skus.registry import get_series
+
+from test_generators import EXPECTED_SHA256
+
+
+def test_instrumented_csv_matches_the_original(tmp_path):
+    run_metrics = RunMetrics()
+    spec = get_series("AF")
+    path = tmp_path / spec.csv_file_name
+    row_count = run_metrics.write_series_csv(spec, str(path), chunk_size=777)
+    assert hashlib.sha256(path.read_bytes()).hexdigest() == EXPECTED_SHA256["AF"]
+    record, = run_metrics.to_dict()["series"]
+    assert record["rows"] == row_count
+    assert record["bytes"] == path.stat().st_size
+    assert set(record["phases"]) == set(PHASES)
+    assert [p.name for p in tmp_path.iterdir()] == [spec.csv_file_name]
@@ -0,0 +1,17 @@
+import hashlib
+
+import pytest
+
+from apex_skus.parallel import generate_series
+from apex_skus.registry import SERIES_NAMES
+
+from test_generators import EXPECTED_SHA256
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 10000), (2, 500)])
+def test_generate_series_matches_the_original_csvs(workers, chunk_size, tmp_path):
+    results = generate_series(None, str(tmp_path), workers=workers, chunk_size=chunk_size)
+    assert list(results) == list(SERIES_NAMES)
+    for name, (path, row_count, _) in results.items():
+        with open(path, "rb") as csvfile:
+            assert hashlib.sha256(csvfile.read()).hexdigest() == EXPECTED_SHA256[name], name
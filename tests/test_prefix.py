@@ -0,0 +1,39 @@
+import pytest
+
+from apex_skus.prefix import SkuPrefixIndex
+
+
+@pytest.fixture(scope="module")
+def index():
+    return SkuPrefixIndex()
+
+
+def test_complete_readme_example(index):
+    completions = index.complete("AFXR075-0")
+    assert completions[:3] == ["AFXR075-003", "AFXR075-004", "AFXR075-005"]
+    assert len(completions) == 23
+    assert all(code.startswith("AFXR075-0") for code in completions)
+    assert index.complete("AFXR075-0", limit=5) == completions[:5]
+    assert index.next_chars("AFXR075-0") == list("0123456789")
+    assert index.explain_prefix("AFXR075-0") is None
+
+
+def test_validate_names_the_exclusion_rule(index):
+    valid, reason = index.validate("ADR090-140-P1")
+    assert not valid
+    assert "'2-stage ratios 140 and 200 up to ADR110'" in reason
+    assert index.validate("AB042-003-S1-P0") == (True, None)
+
+
+def test_unknown_size(index):
+    assert index.complete("ZZ") == []
+    assert index.next_chars("ZZ") == []
+    assert index.explain_prefix("ZZ") == "'ZZ': unknown gearbox size 'ZZ'"
+    assert index.validate("ZZ1-003-P1") == (False, "unknown gearbox size 'ZZ1'")
+
+
+def test_wrong_segment_count(index):
+    assert index.validate("AB042-003-P1") == (False, "AB Series codes have a shaft option")
+    assert index.validate("AB042-003-S1-P0-X")[0] is False
+    assert index.explain_prefix("AB042-003-S1-P0-") == "'AB042-003-S1-P0-': AB Series codes have 4 segments"
+    assert index.complete("AB042-003-S1-P0-") == []
@@ -0,0 +1,51 @@
+import pytest
+
+from apex_skus.engine import iter_rows
+from apex_skus.query import SkuQuery
+from apex_skus.registry import resolve_series
+
+CATALOG = [(spec, row) for spec in resolve_series() for row in iter_rows(spec)]
+
+
+def brute_force(series=None, sizes=None, ratio_range=None, stages=None, shafts=None, backlash=None):
+    low, high = ratio_range or (None, None)
+    matches = []
+    for spec, row in CATALOG:
+        _, size, ratio, shaft, option, sku = row
+        ratio = int(ratio)
+        stage_ratios = set()
+        for stage in stages or ():
+            stage_ratios.update(spec.ratios_1_stage if stage == 1 else spec.ratios_2_stage)
+        if ((series is None or spec.name in series) and (sizes is None or size in sizes)
+                and (low is None or ratio >= low) and (high is None or ratio <= high)
+                and (stages is None or ratio in stage_ratios)
+                and (shafts is None or shaft in shafts) and (backlash is None or option in backlash)):
+            matches.append(row)
+    return matches
+
+
+@pytest.mark.parametrize("predicates", [
+    {},
+    {"series": ["ADR"], "ratio_range": (40, 100), "backlash": ["P1"]},
+    {"series": ["AB", "AFX"]},
+    {"sizes": ["AB142A", "ADS090"]},
+    {"ratio_range": (None, 5)},
+    {"ratio_range": (100, None)},
+    {"stages": [1]},
+    {"stages": [2], "series": ["ABR"]},
+    {"stages": [1, 2], "series": ["ABR"]},
+    {"shafts": ["N/A"]},
+    {"shafts": ["S2", "N/A"], "backlash": ["P0"]},
+    {"shafts": ["S3"]},
+    {"backlash": ["P2"], "ratio_range": (10, 20)},
+])
+def test_count_and_rows_match_a_catalog_filter(predicates):
+    query = SkuQuery(**predicates)
+    expected = brute_force(**predicates)
+    rows = list(query.iter_rows())
+    assert query.count() == len(rows) == len(expected)
+    assert sorted(rows) == sorted(expected)
+
+
+def test_request_example():
+    assert SkuQuery(series="ADR", ratio_range=(40, 100), backlash="P1").count() == 28
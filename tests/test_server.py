@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+import pytest
+
+from apex_skus.server import MAX_LIST_LIMIT, CatalogClient, CatalogService, start_server
+
+
+@pytest.fixture(scope="module")
+def service():
+    return CatalogService(["AB"])
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/validate", {"skus": [1]}),
+    ("/validate", {"sku": {"code": "x"}}),
+    ("/query", {"series": 5}),
+    ("/query", {"stage": [1.5]}),
+    ("/query", {"limit": "many"}),
+    ("/count", {"size": [None]}),
+    ("/list", {"series": [True]}),
+    ("/complete", {"prefix": 5}),
+    ("/complete", {"prefix": "AB042-0", "limit": -1}),
+    ("/query", {"limit": "-1"}),
+    ("/query", {"offset": -5}),
+])
+def test_malformed_parameters_are_client_errors(service, path, body):
+    status, payload = service.handle("POST", path, json.dumps(body))
+    assert status == 400
+    assert "error" in payload
+
+
+def test_malformed_batch_item_fails_alone(service):
+    body = [{"op": "complete", "prefix": 5}, {"op": "count", "series": "AB"}]
+    status, payload = service.handle("POST", "/batch", json.dumps(body))
+    assert status == 200
+    first, second = payload["results"]
+    assert "error" in first
+    assert second["count"] > 0
+
+
+def test_well_formed_integers_are_accepted(service):
+    status, payload = service.handle("POST", "/query", json.dumps({"stage": [1], "limit": 2, "offset": "1"}))
+    assert status == 200
+    assert len(payload["skus"]) == 2
+    assert payload["offset"] == 1
+
+
+def test_query_pages_are_capped():
+    service = CatalogService()
+    status, payload = service.handle("GET", f"/query?limit={MAX_LIST_LIMIT * 10}", b"")
+    assert status == 200
+    assert payload["count"] > MAX_LIST_LIMIT
+    assert len(payload["skus"]) == MAX_LIST_LIMIT
+
+
+def test_complete_limit(service):
+    status, payload = service.handle("GET", "/complete?prefix=AB042-0&limit=3", b"")
+    assert status == 200
+    assert len(payload["completions"]) == 3
+
+
+def test_internal_error_keeps_the_connection(service, monkeypatch):
+    def broken(params):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(service.operations, "count", broken)
+
+    async def exchange():
+        server = await start_server(service, port=0)
+        client = CatalogClient(port=server.sockets[0].getsockname()[1])
+        try:
+            failed = await client.request("/count?series=AB")
+            answered = await client.request("/health")
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+        return failed, answered
+
+    (status, payload), answered = asyncio.run(exchange())
+    assert status == 500
+    assert "boom" in payload["error"]
+    assert answered == (200, {"status": "ok"})
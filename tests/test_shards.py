@@ -0,0 +1,56 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+
+import pytest
+
+from apex_skus.registry import get_series
+from apex_skus.shards import manifest_file_name, write_shards
+from apex_skus.stream import CSV_HEADER
+
+from test_generators import EXPECTED_SHA256
+
+HEADER = (",".join(CSV_HEADER) + "\r\n").encode("utf-8")
+
+
+def decompress(data, compression):
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        zstandard = pytest.importorskip("zstandard")
+        reader = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data), read_across_frames=True)
+        return reader.read()
+    return data
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "zstd"])
+@pytest.mark.parametrize("shard_by, workers", [("rows", 1), ("size", 1), ("rows", 2)])
+def test_shards_concatenate_to_the_original_csv(tmp_path, compression, shard_by, workers):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    manifests = write_shards(["ABR", "ADS"], str(tmp_path), compression, shard_by, shard_rows=500,
+                             workers=workers, chunk_size=128)
+    for name, manifest in manifests.items():
+        body = b""
+        for shard in manifest["shards"]:
+            data = (tmp_path / shard["file"]).read_bytes()
+            assert hashlib.sha256(data).hexdigest() == shard["sha256"]
+            assert len(data) == shard["bytes"]
+            text = decompress(data, compression)
+            assert text.startswith(HEADER)
+            assert text.count(b"\r\n") - 1 == shard["rows"]
+            body += text[len(HEADER):]
+        assert hashlib.sha256(HEADER + body).hexdigest() == EXPECTED_SHA256[name]
+
+
+def test_stale_shards_are_removed(tmp_path):
+    spec = get_series("ABR")
+    first = write_shards([spec], str(tmp_path), "gzip", "rows", shard_rows=100)["ABR"]
+    second = write_shards([spec], str(tmp_path), "gzip", "rows", shard_rows=1000)["ABR"]
+    assert len(first["shards"]) > len(second["shards"])
+    listed = {shard["file"] for shard in second["shards"]}
+    assert set(os.listdir(tmp_path)) == listed | {manifest_file_name(spec)}
+    with open(tmp_path / manifest_file_name(spec)) as manifest_file:
+        assert json.load(manifest_file) == second
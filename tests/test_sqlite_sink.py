@@ -0,0 +1,49 @@
+import sqlite3
+from dataclasses import replace
+
+from apex_skus.engine import iter_rows
+from apex_skus.registry import get_series
+from apex_skus.spec import ExclusionRule
+from apex_skus.sqlite_sink import load_sqlite, sync_sqlite
+
+
+def table_rows(db_path, spec):
+    connection = sqlite3.connect(db_path)
+    try:
+        return {(series, size, f"{ratio:03d}", shaft, backlash, sku) for sku, series, size, ratio, shaft, backlash
+                in connection.execute("SELECT * FROM skus WHERE series = ?", (spec.label,))}
+    finally:
+        connection.close()
+
+
+def spec_rows(spec):
+    return {tuple(row) for row in iter_rows(spec)}
+
+
+def test_changed_rule_is_synced_incrementally(tmp_path):
+    db_path = str(tmp_path / "catalog.db")
+    load_sqlite(db_path)
+    adr = get_series("ADR")
+    first, second = adr.exclusions
+    # Ratio 14 is now excluded from ADR064 up instead of from ADR090 up
+    changed = ExclusionRule(first.description, ("ADR064",) + first.sizes, first.ratios)
+    new_spec = replace(adr, exclusions=(changed, second))
+
+    report = sync_sqlite(db_path, [new_spec])
+    old_rows, new_rows = spec_rows(adr), spec_rows(new_spec)
+    assert report["ADR"] == {"mode": "incremental", "added": len(new_rows - old_rows),
+                             "removed": len(old_rows - new_rows)}
+    assert report["ADR"]["removed"] == 3
+    assert table_rows(db_path, new_spec) == new_rows
+    assert sync_sqlite(db_path, [new_spec])["ADR"]["mode"] == "unchanged"
+
+
+def test_changed_backlash_options_reload_the_series(tmp_path):
+    db_path = str(tmp_path / "catalog.db")
+    load_sqlite(db_path)
+    adr = get_series("ADR")
+    new_spec = replace(adr, backlash_options=("P0", "P1"))
+
+    report = sync_sqlite(db_path, [new_spec])
+    assert report["ADR"] == {"mode": "full", "added": len(spec_rows(new_spec)), "removed": len(spec_rows(adr))}
+    assert table_rows(db_path, new_spec) == spec_rows(new_spec)
@@ -0,0 +1,40 @@
+import tracemalloc
+
+from apex_skus.engine import row_count
+from apex_skus.spec import SeriesSpec
+from apex_skus.stream import write_series_csv
+
+
+def synthetic_spec(backlash_count):
+    """
+    400 sizes x 28 ratios x 3 shafts x backlash_count options, no exclusions:
+    about 100k rows with 3 backlash options. Growing the options rather than
+    the sizes keeps the (size, ratio) tables the same for every scale.
+    """
+    return SeriesSpec(
+        name="SYN",
+        sizes=[f"SYN{i:04d}" for i in range(400)],
+        ratios_1_stage=range(3, 11),
+        ratios_2_stage=range(12, 32),
+        backlash_options=[f"P{i}" for i in range(backlash_count)],
+    )
+
+
+def peak_memory(spec, path):
+    tracemalloc.start()
+    try:
+        write_series_csv(spec, str(path))
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_peak_memory_does_not_grow_with_catalog_size(tmp_path):
+    small, large = synthetic_spec(3), synthetic_spec(30)
+    assert row_count(small) == 100800
+    assert row_count(large) == 1008000
+
+    small_peak = peak_memory(small, tmp_path / "small.csv")
+    large_peak = peak_memory(large, tmp_path / "large.csv")
+    # Streaming keeps one chunk in memory; a 10x larger catalog must not cost 10x
+    assert large_peak < small_peak * 1.5, (small_peak, large_peak)